@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Utility script to convert config.yaml into the prebuilt config.json read at runtime.
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import yaml
+
+# Set up logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Convert config.yaml into a prebuilt JSON config")
+    parser.add_argument(
+        "--config",
+        type=str,
+        default="config.yaml",
+        help="Path to configuration file (default: config.yaml)",
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=None,
+        help="Path to write the JSON config (default: next to the configuration file with a .json suffix)",
+    )
+    return parser.parse_args()
+
+
+def prebuild_config(config_path, output_path=None):
+    """
+    Convert a YAML configuration file into JSON.
+
+    Args:
+        config_path: Path to the configuration file
+        output_path: Path to write the JSON config, defaults to the YAML path with a .json suffix
+
+    Returns:
+        True if successful, False otherwise
+    """
+    try:
+        if not os.path.exists(config_path):
+            logger.error("Configuration file %s not found", config_path)
+            return False
+
+        if output_path is None:
+            output_path = os.path.splitext(config_path)[0] + ".json"
+
+        with open(config_path, "rb") as f:
+            config = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(config, f, ensure_ascii=False)
+
+        logger.info("Wrote prebuilt configuration to %s", output_path)
+        return True
+
+    except Exception as e:
+        logger.error("Error prebuilding configuration: %s", e)
+        return False
+
+
+def main():
+    """Main entry point."""
+    args = parse_args()
+    success = prebuild_config(args.config, args.output)
+    sys.exit(0 if success else 1)
+
+
+if __name__ == "__main__":
+    main()
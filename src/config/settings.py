@@ -2,48 +2,141 @@
 Configuration settings for the HN Summarizer.
 """
 
+import copy
+import functools
+import hashlib
+import json
 import logging
 import os
-import yaml
-from typing import Dict, Any, Optional
-from google.cloud import secretmanager
-import google.auth
+import pickle
+import tempfile
+import threading
+import types
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Mapping, Optional, Tuple
+
+from utils.cache import get_cache_dir
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever the cached structure changes so stale entries are ignored
+_CACHE_VERSION = 1
+# Number of parsed configs kept in the on-disk cache
+_CACHE_MAX_ENTRIES = 8
+
+# Set once the GCP client libraries have failed to import, so later lookups skip the attempt
+_GCP_LIBRARIES_MISSING = False
+# Maximum number of Secret Manager requests issued in parallel
+_SECRET_FETCH_WORKERS = 8
+# Secret Manager client and project ID, created on first use
+_SM_CLIENT: Optional[Any] = None
+_PROJECT_ID: Optional[str] = None
+_SM_CLIENT_LOCK = threading.Lock()
+
+
+def _get_secret_manager_client() -> Optional[Tuple[Any, str]]:
+    """
+    Get the shared Secret Manager client and the GCP project to read secrets from.
+
+    The client and project ID are created on first use and reused afterwards, so the
+    gRPC channel and credential discovery are only set up once per process.
 
-def _get_secret_from_gcp(secret_id: str) -> Optional[str]:
+    Returns:
+        A (client, project_id) tuple, or None if Secret Manager cannot be used.
+    """
+    global _GCP_LIBRARIES_MISSING, _SM_CLIENT, _PROJECT_ID
+
+    if _SM_CLIENT is not None:
+        return _SM_CLIENT, _PROJECT_ID
+
+    with _SM_CLIENT_LOCK:
+        if _SM_CLIENT is not None:
+            return _SM_CLIENT, _PROJECT_ID
+
+        if _GCP_LIBRARIES_MISSING:
+            return None
+
+        # Import lazily: the GCP client libraries pull in gRPC and protobuf, which are
+        # expensive to load and unnecessary when secrets come from the environment
+        try:
+            import google.auth
+            from google.cloud import secretmanager
+        except ImportError as e:
+            _GCP_LIBRARIES_MISSING = True
+            logger.info("GCP client libraries not available, skipping Secret Manager lookups: %s", e)
+            return None
+
+        try:
+            # Attempt to get project_id from environment, then from default credentials
+            project_id = _PROJECT_ID or os.environ.get("GCP_PROJECT_ID")
+            if not project_id:
+                _, project_id = google.auth.default()
+
+            if not project_id:
+                logger.warning("GCP_PROJECT_ID not set and could not be determined from credentials.")
+                return None
+            _PROJECT_ID = project_id
+
+            _SM_CLIENT = secretmanager.SecretManagerServiceClient()
+            return _SM_CLIENT, _PROJECT_ID
+        except Exception as e:
+            # Log softly, as we might not be in a GCP environment
+            logger.info("Could not initialize GCP Secret Manager client: %s", e)
+            return None
+
+
+def _get_secret_from_gcp(client: Any, project_id: str, secret_id: str) -> Optional[str]:
     """
     Retrieves a secret from Google Cloud Secret Manager.
 
     Args:
+        client: Secret Manager client to use
+        project_id: GCP project that owns the secret
         secret_id: The ID of the secret in Secret Manager (e.g., "HN_SUMMARIZER_GEMINI_API_KEY").
 
     Returns:
         The secret value as a string, or None if an error occurs or the secret is not found.
     """
     try:
-        # Attempt to get project_id from environment, then from default credentials
-        project_id = os.environ.get("GCP_PROJECT_ID")
-        if not project_id:
-            _, project_id = google.auth.default()
-        
-        if not project_id:
-            logger.warning("GCP_PROJECT_ID not set and could not be determined from credentials.")
-            return None
-
-        client = secretmanager.SecretManagerServiceClient()
         secret_name = f"projects/{project_id}/secrets/{secret_id}/versions/latest"
         response = client.access_secret_version(name=secret_name)
         payload = response.payload.data.decode("UTF-8")
-        logger.info(f"Successfully fetched secret '{secret_id}' from GCP Secret Manager.")
+        logger.info("Successfully fetched secret '%s' from GCP Secret Manager.", secret_id)
         return payload
     except Exception as e:
-        # Log softly, as we might not be in a GCP environment or the secret might not be mandatory
-        logger.info(f"Could not fetch secret '{secret_id}' from GCP Secret Manager: {e}")
+        # Log softly, as the secret might not be mandatory
+        logger.info("Could not fetch secret '%s' from GCP Secret Manager: %s", secret_id, e)
         return None
 
 
+def _get_secrets_from_gcp(secret_ids: List[str]) -> Dict[str, Optional[str]]:
+    """
+    Retrieves several secrets from Google Cloud Secret Manager concurrently.
+
+    All requests share one client and run in parallel, so the total latency is that of
+    the slowest request rather than the sum of all of them.
+
+    Args:
+        secret_ids: IDs of the secrets to fetch
+
+    Returns:
+        Dictionary mapping each secret ID to its value, or None if it could not be fetched.
+    """
+    if not secret_ids:
+        return {}
+
+    secret_manager = _get_secret_manager_client()
+    if secret_manager is None:
+        return {secret_id: None for secret_id in secret_ids}
+
+    client, project_id = secret_manager
+    with ThreadPoolExecutor(max_workers=min(_SECRET_FETCH_WORKERS, len(secret_ids))) as executor:
+        futures = {
+            secret_id: executor.submit(_get_secret_from_gcp, client, project_id, secret_id) for secret_id in secret_ids
+        }
+    return {secret_id: future.result() for secret_id, future in futures.items()}
+
+
 def load_config(config_path: str) -> Dict[str, Any]:
     """
     Load configuration from a YAML file.
@@ -55,35 +148,159 @@ def load_config(config_path: str) -> Dict[str, Any]:
         Configuration dictionary
     """
     try:
-        logger.info(f"Loading configuration from {config_path}")
+        logger.info("Loading configuration from %s", config_path)
 
         if not os.path.exists(config_path):
-            logger.warning(f"Configuration file {config_path} not found, using default configuration")
+            logger.warning("Configuration file %s not found, using default configuration", config_path)
             return get_default_config()
 
-        with open(config_path, "r") as f:
-            config = yaml.safe_load(f)
+        config = _read_config_file(config_path)
 
-        # Validate and merge with defaults
-        validated_config = validate_config(config)
+        if os.environ.get("HN_SUMMARIZER_ENV", "prod") == "dev":
+            # Validate and merge with defaults
+            config = validate_config(config)
+        else:
+            # Production fills in the same defaults but skips the validation checks
+            config = _merge_defaults(config)
+            if config["security"].get("use_environment_variables", True):
+                _load_from_environment(config)
 
-        logger.info(f"Configuration loaded successfully")
-        return validated_config
+        logger.info("Configuration loaded successfully")
+        return config
 
     except Exception as e:
-        logger.error(f"Error loading configuration: {str(e)}")
+        logger.error("Error loading configuration: %s", e)
         logger.warning("Falling back to default configuration")
         return get_default_config()
 
 
-def get_default_config() -> Dict[str, Any]:
+def _read_config_file(config_path: str) -> Any:
     """
-    Get default configuration.
+    Parse a configuration file, preferring a prebuilt JSON copy when one is available.
+
+    prebuild_config.py writes the YAML file as JSON next to it (config.yaml becomes
+    config.json). The JSON copy is used as long as it is not older than the YAML file,
+    so the YAML parser is only imported when the prebuilt copy is missing or stale.
+
+    Args:
+        config_path: Path to the YAML configuration file
 
     Returns:
-        Default configuration dictionary
+        Parsed configuration, as a copy the caller is free to modify
     """
-    return {
+    json_path = os.path.splitext(config_path)[0] + ".json"
+    try:
+        if os.stat(json_path).st_mtime_ns >= os.stat(config_path).st_mtime_ns:
+            with open(json_path, "rb") as f:
+                config = json.load(f)
+            logger.debug("Loaded prebuilt configuration from %s", json_path)
+            return config
+    except FileNotFoundError:
+        pass
+    except ValueError as e:
+        logger.warning("Ignoring invalid prebuilt configuration %s: %s", json_path, e)
+
+    return _read_yaml_config(config_path)
+
+
+def _read_yaml_config(config_path: str) -> Any:
+    """
+    Parse a YAML configuration file, reusing a cached parse if the file is unchanged.
+
+    Parses are memoized in memory and on disk, keyed by the absolute path, modification
+    time and size of the file, so any edit produces a new key. Only the parsed file
+    contents are cached; values loaded from the environment or Secret Manager are never
+    written to disk.
+
+    Args:
+        config_path: Path to the configuration file
+
+    Returns:
+        Parsed YAML document, as a copy the caller is free to modify
+    """
+    abs_path = os.path.abspath(config_path)
+    st = os.stat(abs_path)
+    return copy.deepcopy(_read_yaml_config_cached(abs_path, st.st_mtime_ns, st.st_size))
+
+
+@functools.lru_cache(maxsize=4)
+def _read_yaml_config_cached(abs_path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML configuration file through the on-disk cache. The result must not be modified."""
+    cache_id = f"{_CACHE_VERSION}:{abs_path}:{mtime_ns}:{size}"
+    key = hashlib.blake2b(cache_id.encode(), digest_size=16).hexdigest()
+    cache_dir = get_cache_dir()
+    cache_file = os.path.join(cache_dir, f"{key}.pkl")
+
+    try:
+        with open(cache_file, "rb") as f:
+            config = pickle.load(f)
+        # Touch the entry so pruning keeps recently used configs
+        os.utime(cache_file)
+        logger.debug("Loaded parsed configuration from cache %s", cache_file)
+        return config
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.debug("Ignoring unreadable config cache %s: %s", cache_file, e)
+
+    # Imported lazily so deployments using the prebuilt JSON config never load the YAML parser
+    import yaml
+
+    # libyaml detects the encoding itself, so skip text-mode decoding and newline translation
+    with open(abs_path, "rb") as f:
+        config = yaml.load(f.read(), Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+    _write_config_cache(cache_dir, cache_file, config)
+    return config
+
+
+# Lets tests drop the in-memory parses; the on-disk cache is keyed by mtime and size, so it can stay
+load_config.cache_clear = _read_yaml_config_cached.cache_clear
+
+
+def _write_config_cache(cache_dir: str, cache_file: str, config: Any) -> None:
+    """
+    Atomically write a parsed configuration to the cache and prune old entries.
+
+    Failures are logged and ignored, as the cache is only an optimization.
+    """
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(config, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_file)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+        # Keep only the most recently used entries
+        entries = [os.path.join(cache_dir, name) for name in os.listdir(cache_dir) if name.endswith(".pkl")]
+        entries.sort(key=os.path.getmtime, reverse=True)
+        for stale in entries[_CACHE_MAX_ENTRIES:]:
+            os.unlink(stale)
+    except OSError as e:
+        logger.debug("Could not write config cache to %s: %s", cache_dir, e)
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively wrap dictionaries in read-only mapping proxies."""
+    if isinstance(value, dict):
+        return types.MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Recursively copy read-only mappings into regular, mutable dictionaries."""
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    return value
+
+
+# Read-only default configuration, built once at import time
+_DEFAULT_CONFIG: Mapping[str, Any] = _freeze(
+    {
         "summarizer": {
             "provider": "gemini",
             "gemini_model": "gemini-1.5-flash-latest",
@@ -107,126 +324,153 @@ def get_default_config() -> Dict[str, Any]:
         "security": {
             "use_environment_variables": True,
             "encrypt_api_keys": False,
-            "use_gcp_secret_manager": True 
+            "use_gcp_secret_manager": True,
         },
     }
+)
+# Decoding the serialized defaults is a cheap way to get a fresh, mutable deep copy
+_DEFAULT_CONFIG_JSON = json.dumps(_DEFAULT_CONFIG, default=dict)
+
+
+def get_default_config() -> Dict[str, Any]:
+    """
+    Get default configuration.
+
+    Returns:
+        Default configuration dictionary
+    """
+    return json.loads(_DEFAULT_CONFIG_JSON)
 
 
 def validate_config(config: Dict[str, Any]) -> Dict[str, Any]:
     """
     Validate and normalize configuration.
 
+    Fills in the defaults exactly like the production path does, then checks the result,
+    so a config that validates in development behaves the same in production.
+
     Args:
         config: Configuration dictionary to validate
 
     Returns:
         Validated configuration dictionary
+
+    Raises:
+        ValueError: If a section or a required setting has the wrong type
     """
-    default_config = get_default_config()
+    for section in _DEFAULT_CONFIG:
+        if not isinstance(config.get(section, {}), dict):
+            raise ValueError(f"Config section '{section}' must be a mapping")
 
-    # Ensure top-level sections exist
-    for section in default_config:
-        if section not in config:
-            config[section] = {}
+    config = _merge_defaults(config)
 
-    # Validate summarizer section
-    if "provider" not in config["summarizer"]:
-        config["summarizer"]["provider"] = default_config["summarizer"]["provider"]
+    # Validate the settings the application reads unconditionally
+    if not isinstance(config["summarizer"]["provider"], str) or not config["summarizer"]["provider"]:
+        raise ValueError("summarizer.provider must be a non-empty string")
+    if not isinstance(config["delivery"]["method"], str) or not config["delivery"]["method"]:
+        raise ValueError("delivery.method must be a non-empty string")
 
     # Check for environment variables if configured
-    if config.get("security", {}).get("use_environment_variables", True):
+    if config["security"].get("use_environment_variables", True):
         _load_from_environment(config)
 
     return config
 
 
+def _merge_defaults(config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Fill in missing sections and top-level keys of each section from the defaults.
+
+    Args:
+        config: Configuration dictionary to update
+
+    Returns:
+        The updated configuration dictionary
+    """
+    for section, section_defaults in _DEFAULT_CONFIG.items():
+        section_config = config.setdefault(section, {})
+        for key, value in section_defaults.items():
+            if key not in section_config:
+                section_config[key] = _thaw(value)
+    return config
+
+
+def _parse_recipients(value: str) -> List[str]:
+    """Parse a comma-separated list of email recipients, skipping empty entries."""
+    return list(filter(None, (r.strip() for r in value.split(","))))
+
+
+# Sensitive settings that can be supplied through the environment or GCP Secret Manager, as
+# (backend, environment variable, secret ID, config path, warn if missing, value parser).
+# Parsers receive a non-empty string and must not raise.
+# A setting is only loaded when its backend is the configured provider or a delivery method.
+_ENV_SETTINGS = (
+    ("gemini", "GEMINI_API_KEY", "HN_SUMMARIZER_GEMINI_API_KEY", ("summarizer", "gemini_api_key"), True, None),
+    ("email", "EMAIL_USERNAME", "HN_SUMMARIZER_EMAIL_USERNAME", ("delivery", "email", "username"), True, None),
+    ("email", "EMAIL_PASSWORD", "HN_SUMMARIZER_EMAIL_PASSWORD", ("delivery", "email", "password"), True, None),
+    # Optional, defaults to the username
+    ("email", "EMAIL_SENDER", "HN_SUMMARIZER_EMAIL_SENDER", ("delivery", "email", "sender"), False, None),
+    (
+        "email",
+        "EMAIL_RECIPIENTS",
+        "HN_SUMMARIZER_EMAIL_RECIPIENTS",
+        ("delivery", "email", "recipients"),
+        True,
+        _parse_recipients,
+    ),
+    (
+        "slack",
+        "SLACK_WEBHOOK_URL",
+        "HN_SUMMARIZER_SLACK_WEBHOOK_URL",
+        ("delivery", "slack", "webhook_url"),
+        True,
+        None,
+    ),
+    # Optional, overrides the webhook's default channel
+    ("slack", "SLACK_CHANNEL", "HN_SUMMARIZER_SLACK_CHANNEL", ("delivery", "slack", "channel"), False, None),
+)
+
+
 def _load_from_environment(config: Dict[str, Any]) -> None:
     """
     Load sensitive configuration from environment variables, with a fallback to GCP Secret Manager.
 
+    Values already present in the configuration file take precedence.
+
     Args:
         config: Configuration dictionary to update
     """
+    env = os.environ
     use_gcp = config.get("security", {}).get("use_gcp_secret_manager", True)
-
-    # LLM API keys
-    if config["summarizer"]["provider"] == "gemini":
-        gemini_api_key_val = os.environ.get("GEMINI_API_KEY")
-        if not gemini_api_key_val and use_gcp:
-            gemini_api_key_val = _get_secret_from_gcp("HN_SUMMARIZER_GEMINI_API_KEY")
-        
-        if gemini_api_key_val and not config["summarizer"].get("gemini_api_key"):
-            config["summarizer"]["gemini_api_key"] = gemini_api_key_val
-            logger.info("Loaded Gemini API Key.")
-        elif not config["summarizer"].get("gemini_api_key"):
-            logger.warning("GEMINI_API_KEY not found in environment, GCP Secret Manager, or config file.")
-
-    # Delivery credentials
-    delivery_methods = config["delivery"]["method"].split(",")
-
-    # Email configuration
-    if "email" in delivery_methods:
-        email_config = config["delivery"].get("email", {})
-        
-        email_username_val = os.environ.get("EMAIL_USERNAME")
-        if not email_username_val and use_gcp:
-            email_username_val = _get_secret_from_gcp("HN_SUMMARIZER_EMAIL_USERNAME")
-        if email_username_val and not email_config.get("username"):
-            email_config["username"] = email_username_val
-            logger.info("Loaded EMAIL_USERNAME.")
-        elif not email_config.get("username"):
-            logger.warning("EMAIL_USERNAME not found in environment, GCP Secret Manager, or config file.")
-
-        email_password_val = os.environ.get("EMAIL_PASSWORD")
-        if not email_password_val and use_gcp:
-            email_password_val = _get_secret_from_gcp("HN_SUMMARIZER_EMAIL_PASSWORD")
-        if email_password_val and not email_config.get("password"):
-            email_config["password"] = email_password_val
-            logger.info("Loaded EMAIL_PASSWORD.")
-        elif not email_config.get("password"):
-            logger.warning("EMAIL_PASSWORD not found in environment, GCP Secret Manager, or config file.")
-
-        email_sender_val = os.environ.get("EMAIL_SENDER")
-        if not email_sender_val and use_gcp:
-            email_sender_val = _get_secret_from_gcp("HN_SUMMARIZER_EMAIL_SENDER")
-        if email_sender_val and not email_config.get("sender"):
-            email_config["sender"] = email_sender_val
-            logger.info("Loaded EMAIL_SENDER.")
-        # No warning if sender is not found, as it might be optional or default to username
-
-        email_recipients_val = os.environ.get("EMAIL_RECIPIENTS")
-        if not email_recipients_val and use_gcp:
-            email_recipients_val = _get_secret_from_gcp("HN_SUMMARIZER_EMAIL_RECIPIENTS")
-        if email_recipients_val and not email_config.get("recipients"):
-            try:
-                email_config["recipients"] = [r.strip() for r in email_recipients_val.split(",")]
-                logger.info("Loaded EMAIL_RECIPIENTS.")
-            except Exception as e:
-                logger.error(f"Error parsing EMAIL_RECIPIENTS from env/GCP: {str(e)}")
-        elif not email_config.get("recipients"):
-            logger.warning("EMAIL_RECIPIENTS not found in environment, GCP Secret Manager, or config file.")
-            
-        config["delivery"]["email"] = email_config
-
-    # Slack configuration
-    if "slack" in delivery_methods:
-        slack_config = config["delivery"].get("slack", {})
-
-        slack_webhook_url_val = os.environ.get("SLACK_WEBHOOK_URL")
-        if not slack_webhook_url_val and use_gcp:
-            slack_webhook_url_val = _get_secret_from_gcp("HN_SUMMARIZER_SLACK_WEBHOOK_URL")
-        if slack_webhook_url_val and not slack_config.get("webhook_url"):
-            slack_config["webhook_url"] = slack_webhook_url_val
-            logger.info("Loaded SLACK_WEBHOOK_URL.")
-        elif not slack_config.get("webhook_url"):
-            logger.warning("SLACK_WEBHOOK_URL not found in environment, GCP Secret Manager, or config file.")
-
-        slack_channel_val = os.environ.get("SLACK_CHANNEL")
-        if not slack_channel_val and use_gcp:
-            slack_channel_val = _get_secret_from_gcp("HN_SUMMARIZER_SLACK_CHANNEL")
-        if slack_channel_val and not slack_config.get("channel"):
-            slack_config["channel"] = slack_channel_val
-            logger.info("Loaded SLACK_CHANNEL.")
-        # No warning if channel is not found, as it might be optional
-
-        config["delivery"]["slack"] = slack_config
+    delivery_methods = frozenset(m.strip() for m in config["delivery"].get("method", "").split(","))
+    enabled_backends = delivery_methods | {config["summarizer"].get("provider")}
+
+    # Collect the settings the enabled backends need, with the config section they belong to
+    settings = []
+    for backend, env_var, secret_id, path, required, parser in _ENV_SETTINGS:
+        if backend not in enabled_backends:
+            continue
+        section = functools.reduce(lambda parent, key: parent.setdefault(key, {}), path[:-1], config)
+        if not section.get(path[-1]):
+            settings.append((env_var, secret_id, section, path[-1], required, parser))
+
+    if not settings:
+        return
+
+    # Fetch everything missing from the environment from Secret Manager in one batch
+    secrets = {}
+    if use_gcp:
+        secrets = _get_secrets_from_gcp([secret_id for env_var, secret_id, *_ in settings if not env.get(env_var)])
+
+    for env_var, secret_id, section, key, required, parser in settings:
+        value = env.get(env_var) or secrets.get(secret_id)
+        if not value:
+            if required:
+                logger.warning("%s not found in environment, GCP Secret Manager, or config file.", env_var)
+            continue
+
+        if parser is not None:
+            value = parser(value)
+
+        section[key] = value
+        logger.info("Loaded %s.", env_var)
@@ -6,6 +6,7 @@ HN Summarizer - A tool to fetch, summarize, and deliver top Hacker News stories.
 import logging
 import argparse
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from urllib.parse import urlparse
 
@@ -18,6 +19,9 @@ from config.settings import load_config
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of stories extracted in parallel
+_MAX_WORKERS = 8
+
 
 def parse_args():
     """Parse command line arguments."""
@@ -38,6 +42,83 @@ def parse_args():
     return parser.parse_args()
 
 
+def _extract_story(story: dict, content_extractor: ContentExtractor) -> dict:
+    """
+    Extract the content of a single story.
+
+    Args:
+        story: Story data from Hacker News
+        content_extractor: Extractor used to fetch the story content
+
+    Returns:
+        Content dictionary, with access_restricted=True if the content could not be extracted
+    """
+    try:
+        logger.info("Extracting content from: %s", story["url"])
+        return content_extractor.extract(story["url"])
+    except Exception as e:
+        logger.error("Error processing story %s: %s", story["title"], e)
+        return {"domain": urlparse(story.get("url", "")).netloc, "access_restricted": True}
+
+
+def _restricted_summary(story: dict, domain: str) -> dict:
+    """Build the summary entry for a story that could not be summarized."""
+    return {
+        "story": story,  # Include the original story data
+        "content": {
+            "url": story.get("url"),
+            "domain": domain,
+            "title": story.get("title"),
+            "content_length": 0,
+        },
+        "summary": "このコンテンツはアクセス制限があるため要約できませんでした。",
+        "access_restricted": True,
+        "summarized_at": time.time(),
+    }
+
+
+def _summarize_stories(stories: list, content_extractor: ContentExtractor, summarizer: Summarizer) -> list:
+    """
+    Extract all stories concurrently, then summarize the accessible ones in one batch.
+
+    Args:
+        stories: Stories from Hacker News
+        content_extractor: Extractor used to fetch the story content
+        summarizer: Summarizer used to summarize the content
+
+    Returns:
+        Summary dictionaries in the original ranking order, with access_restricted=True
+        for stories that could not be summarized
+    """
+    if not stories:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(stories))) as executor:
+        contents = list(executor.map(lambda story: _extract_story(story, content_extractor), stories))
+
+    accessible = [
+        (story, content) for story, content in zip(stories, contents) if not content.get("access_restricted", False)
+    ]
+    try:
+        batch_summaries = iter(summarizer.summarize_batch(accessible))
+    except Exception as e:
+        # Still deliver the stories, without summaries, rather than aborting the run
+        logger.error("Error summarizing stories: %s", e)
+        batch_summaries = iter([None] * len(accessible))
+
+    summaries = []
+    for story, content in zip(stories, contents):
+        summary = None
+        if content.get("access_restricted", False):
+            # Add story with just title and URL, no summary
+            logger.info("Access restricted for: %s - including without summary", story["title"])
+        else:
+            summary = next(batch_summaries)
+
+        summaries.append(summary or _restricted_summary(story, content.get("domain")))
+    return summaries
+
+
 def main():
     """Main function to run the HN summarizer."""
     args = parse_args()
@@ -46,7 +127,7 @@ def main():
     log_level = logging.DEBUG if args.debug else logging.INFO
     setup_logger(log_level)
 
-    logger.info(f"Starting HN Summarizer at {datetime.now().isoformat()}")
+    logger.info("Starting HN Summarizer at %s", datetime.now().isoformat())
 
     try:
         # Load configuration
@@ -63,73 +144,29 @@ def main():
         delivery_service = DeliveryService(config["delivery"])
 
         # Fetch top stories
-        logger.info(f"Fetching top {args.top} stories from Hacker News")
+        logger.info("Fetching top %d stories from Hacker News", args.top)
         top_stories = hn_fetcher.fetch_top_stories(args.top)
 
-        # Process each story
-        summaries = []
-        for story in top_stories:
-            try:
-                # Extract content
-                logger.info(f"Extracting content from: {story['url']}")
-                content = content_extractor.extract(story["url"])
-
-                # Check if access is restricted
-                if content.get("access_restricted", False):
-                    # Add story with just title and URL, no summary
-                    logger.info(f"Access restricted for: {story['title']} - including without summary")
-                    summaries.append(
-                        {
-                            "story": story,  # Include the original story data
-                            "content": {
-                                "url": story.get("url"),
-                                "domain": content.get("domain"),
-                                "title": story.get("title"),
-                                "content_length": 0,
-                            },
-                            "summary": "このコンテンツはアクセス制限があるため要約できませんでした。",
-                            "access_restricted": True,
-                            "summarized_at": time.time(),
-                        }
-                    )
-                    continue
-
-                # Summarize content if accessible
-                logger.info(f"Summarizing: {story['title']}")
-                summary = summarizer.summarize(story, content)
-
-                summaries.append(summary)
-            except Exception as e:
-                logger.error(f"Error processing story {story['title']}: {str(e)}")
-                # Add the story with just title and URL for access-restricted articles
-                summaries.append(
-                    {
-                        "story": story,
-                        "content": {
-                            "url": story.get("url"),
-                            "domain": urlparse(story.get("url", "")).netloc,
-                            "title": story.get("title"),
-                            "content_length": 0,
-                        },
-                        "summary": "このコンテンツはアクセス制限があるため要約できませんでした。",
-                        "access_restricted": True,
-                        "summarized_at": time.time(),
-                    }
-                )
+        # Process stories, keeping the original ranking order
+        summaries = _summarize_stories(top_stories, content_extractor, summarizer)
 
         # Deliver summaries
         if summaries:
-            logger.info(f"Delivering {len(summaries)} summaries via {config['delivery']['method']}")
+            logger.info("Delivering %d summaries via %s", len(summaries), config["delivery"]["method"])
             delivery_service.deliver(summaries)
-            logger.info("Delivery completed successfully")
+            # Wait for the background deliveries before the process exits
+            if delivery_service.flush():
+                logger.info("Delivery completed successfully")
+            else:
+                logger.warning("Delivery finished with errors")
         else:
             logger.warning("No summaries to deliver")
 
     except Exception as e:
-        logger.error(f"An error occurred: {str(e)}")
+        logger.error("An error occurred: %s", e)
         raise
 
-    logger.info(f"HN Summarizer completed at {datetime.now().isoformat()}")
+    logger.info("HN Summarizer completed at %s", datetime.now().isoformat())
 
 
 if __name__ == "__main__":
@@ -2,16 +2,167 @@
 Service for extracting content from web pages.
 """
 
+import atexit
+import functools
 import logging
+import os
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from requests.utils import DEFAULT_ACCEPT_ENCODING, get_encoding_from_headers
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 import time
-from typing import Optional
-import re
+from typing import Mapping, Optional, Tuple
 from urllib.parse import urlparse
 
+from utils.cache import get_cache_dir
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+try:
+    import lxml  # noqa: F401
+
+    _PARSER = "lxml"
+except ImportError:
+    _PARSER = "html.parser"
+
 logger = logging.getLogger(__name__)
 
+# Common content container IDs and classes, in order of preference
+_CONTAINER_IDS = ["content", "main", "article", "post", "entry"]
+_CONTAINER_CLASSES = ["content", "article", "post", "entry", "story"]
+
+# Rank of each matching (lowercased) ID or class, lower is better: IDs beat classes, which beat <article>
+_ID_RANKS = {name: rank for rank, value in enumerate(_CONTAINER_IDS) for name in (value, f"main-{value}")}
+_CLASS_RANKS = {
+    name: rank
+    for rank, value in enumerate(_CONTAINER_CLASSES, start=len(_CONTAINER_IDS))
+    for name in (value, f"main-{value}")
+}
+_ARTICLE_RANK = len(_CONTAINER_IDS) + len(_CONTAINER_CLASSES)
+
+# Only build the parts of the tree that can hold the title or main content. This skips
+# <head> metadata, scripts and styles; ones nested inside kept elements still need removing.
+_STRAINER = SoupStrainer(["title", "body", "article", "main", "div", "section", "p", "h1", "h2", "h3"])
+
+# Maximum number of bytes read from a page, and the chunk size used to read it
+_MAX_BYTES = 4 << 20
+_CHUNK_SIZE = 64 << 10
+# Content types that are parsed; responses without a Content-Type are parsed as well
+_HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
+
+# Connection pool size for the HTTP session
+_POOL_SIZE = 32
+_ACCEPT = "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8"
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_session(user_agent: str, cache_expire_after: Optional[int]) -> requests.Session:
+    """
+    Get the HTTP session shared by every extractor with the given settings.
+
+    Args:
+        user_agent: User-Agent string sent with requests
+        cache_expire_after: Seconds to keep fetched pages in the on-disk HTTP cache, or None to disable caching
+
+    Returns:
+        Session whose connections are reused across ContentExtractor instances
+    """
+    session = _create_session(cache_expire_after)
+    session.headers.update(
+        {
+            "User-Agent": user_agent,
+            "Accept": _ACCEPT,
+            # Only advertise encodings urllib3 can decode (br/zstd when their packages are installed)
+            "Accept-Encoding": DEFAULT_ACCEPT_ENCODING,
+        }
+    )
+
+    # Pages come from many different hosts, so keep a larger pool of connections around
+    adapter = HTTPAdapter(
+        pool_connections=_POOL_SIZE,
+        pool_maxsize=_POOL_SIZE,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    atexit.register(session.close)
+    return session
+
+
+def _is_html(content_type: str) -> bool:
+    """Check whether a Content-Type header is HTML; a missing Content-Type counts as HTML."""
+    return not content_type or content_type.lower().startswith(_HTML_CONTENT_TYPES)
+
+
+def _is_cacheable(response: requests.Response) -> bool:
+    """
+    Decide whether a response goes into the HTTP cache.
+
+    requests-cache reads the whole body of every response it stores before returning it, so
+    anything fetch() would skip must be filtered out here to avoid downloading it in full.
+    HTML responses are stored with at most _MAX_BYTES of their body: ones without a usable
+    Content-Length, such as chunked pages, have their capped body read here, so the cache
+    stores that instead of reading the rest of the stream.
+    """
+    headers = response.headers
+    if not _is_html(headers.get("Content-Type", "")):
+        return False
+
+    try:
+        return int(headers["Content-Length"]) <= _MAX_BYTES
+    except (KeyError, ValueError):
+        pass
+
+    if not response._content_consumed:
+        response._content = _read_capped_body(response)
+        response._content_consumed = True
+    return True
+
+
+def _read_capped_body(response: requests.Response) -> bytes:
+    """Read a streamed response body, stopping once _MAX_BYTES have been read."""
+    chunks = []
+    size = 0
+    for chunk in response.iter_content(chunk_size=_CHUNK_SIZE):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= _MAX_BYTES:
+            logger.info("Truncating %s at %d bytes", response.url, _MAX_BYTES)
+            break
+    return b"".join(chunks)[:_MAX_BYTES]
+
+
+def _create_session(cache_expire_after: Optional[int]) -> requests.Session:
+    """Create the HTTP session, backed by an on-disk cache when requests-cache is available."""
+    if requests_cache is None or cache_expire_after is None:
+        return requests.Session()
+
+    try:
+        cache_dir = get_cache_dir()
+        os.makedirs(cache_dir, exist_ok=True)
+        return requests_cache.CachedSession(
+            os.path.join(cache_dir, "http_cache"),
+            backend="sqlite",
+            # Follow each page's Cache-Control and ETag headers, with expire_after as the fallback
+            cache_control=True,
+            expire_after=cache_expire_after,
+            allowable_codes=(200,),
+            filter_fn=_is_cacheable,
+            stale_if_error=True,
+        )
+    except Exception as e:
+        logger.warning("Could not set up HTTP cache, fetching without it: %s", e)
+        return requests.Session()
+
 
 class ContentExtractor:
     """
@@ -21,18 +172,28 @@ class ContentExtractor:
     attempting to filter out navigation, ads, and other non-content elements.
     """
 
-    def __init__(self, timeout: int = 30, user_agent: Optional[str] = None):
+    def __init__(
+        self,
+        timeout: int = 30,
+        user_agent: Optional[str] = None,
+        keep_html: bool = False,
+        cache_expire_after: Optional[int] = 3600,
+    ):
         """
         Initialize the Content Extractor.
 
         Args:
             timeout: Request timeout in seconds
             user_agent: Custom User-Agent string to use for requests
+            keep_html: Whether to include the raw HTML of the page in extraction results
+            cache_expire_after: Seconds to keep fetched pages in the on-disk HTTP cache,
+                or None to disable caching. Ignored if requests-cache is not installed.
         """
         self.timeout = timeout
+        self.keep_html = keep_html
         self.user_agent = user_agent or "HN Summarizer Bot/1.0"
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": self.user_agent})
+        # Extractors with the same settings share a session, so their connections are reused
+        self.session = _shared_session(self.user_agent, cache_expire_after)
 
     def extract(self, url: str) -> dict:
         """
@@ -45,32 +206,66 @@ class ContentExtractor:
             Dictionary containing extracted content and metadata,
             with access_restricted=True if the content cannot be accessed
         """
+        fetched = self.fetch(url)
+        if fetched is None:
+            return self._restricted_result(url, urlparse(url).netloc)
+
+        body, headers = fetched
+        return self.parse(url, body, headers)
+
+    def fetch(self, url: str) -> Optional[Tuple[bytes, Mapping[str, str]]]:
+        """
+        Fetch the raw body of a web page.
+
+        Args:
+            url: The URL to fetch
+
+        Returns:
+            Tuple of the (possibly truncated) body and the response headers,
+            or None if the content cannot be accessed
+        """
         try:
-            logger.debug(f"Fetching content from: {url}")
+            logger.debug("Fetching content from: %s", url)
 
-            # Parse domain for later use
-            domain = urlparse(url).netloc
+            # Stream the body so oversized or non-HTML responses aren't downloaded
+            with self.session.get(url, timeout=self.timeout, stream=True) as response:
+                # Handle access restrictions (401, 403, etc.)
+                if response.status_code in [401, 403, 407, 451]:
+                    logger.warning("Access restricted for %s (HTTP %d)", url, response.status_code)
+                    return None
 
-            # Fetch the page
-            response = self.session.get(url, timeout=self.timeout)
+                response.raise_for_status()
 
-            # Handle access restrictions (401, 403, etc.)
-            if response.status_code in [401, 403, 407, 451]:
-                logger.warning(f"Access restricted for {url} (HTTP {response.status_code})")
-                return {
-                    "url": url,
-                    "domain": domain,
-                    "title": None,  # No title extracted
-                    "content": None,  # No content extracted
-                    "html": None,
-                    "extracted_at": time.time(),
-                    "access_restricted": True,
-                }
+                # Skip PDFs, images and other content we can't extract text from
+                content_type = response.headers.get("Content-Type", "")
+                if not _is_html(content_type):
+                    logger.warning("Skipping non-HTML content at %s (%s)", url, content_type)
+                    return None
 
-            response.raise_for_status()
+                return _read_capped_body(response), response.headers
+
+        except requests.RequestException as e:
+            logger.error("Error fetching URL %s: %s", url, e)
+            return None
+        except Exception as e:
+            logger.error("Error extracting content from %s: %s", url, e)
+            raise
 
-            # Parse with BeautifulSoup
-            soup = BeautifulSoup(response.text, "html.parser")
+    def parse(self, url: str, body: bytes, headers: Mapping[str, str]) -> dict:
+        """
+        Extract content from a fetched web page.
+
+        Args:
+            url: The URL the page was fetched from
+            body: Raw body of the page
+            headers: Response headers of the page
+
+        Returns:
+            Dictionary containing extracted content and metadata
+        """
+        try:
+            # Parse with BeautifulSoup, passing bytes so the parser detects the encoding itself
+            soup = BeautifulSoup(body, _PARSER, parse_only=_STRAINER)
 
             # Extract basic metadata
             title = self._extract_title(soup)
@@ -81,36 +276,37 @@ class ContentExtractor:
             # Create result dictionary
             result = {
                 "url": url,
-                "domain": domain,
+                "domain": urlparse(url).netloc,
                 "title": title,
                 "content": content,
-                "html": response.text,
                 "extracted_at": time.time(),
                 "access_restricted": False,
             }
+            if self.keep_html:
+                # Store the full HTML for potential further processing
+                encoding = get_encoding_from_headers(headers) or "utf-8"
+                result["html"] = body.decode(encoding, errors="replace")
 
             content_length = len(content)
-            logger.info(f"Successfully extracted {content_length} characters from {url}")
+            logger.info("Successfully extracted %d characters from %s", content_length, url)
 
             return result
 
-        except requests.RequestException as e:
-            logger.error(f"Error fetching URL {url}: {str(e)}")
-
-            # Return restricted access result for request exceptions too
-            return {
-                "url": url,
-                "domain": urlparse(url).netloc,
-                "title": None,
-                "content": None,
-                "html": None,
-                "extracted_at": time.time(),
-                "access_restricted": True,
-            }
         except Exception as e:
-            logger.error(f"Error extracting content from {url}: {str(e)}")
+            logger.error("Error extracting content from %s: %s", url, e)
             raise
 
+    def _restricted_result(self, url: str, domain: str) -> dict:
+        """Build the result returned when the content of a URL cannot be accessed."""
+        return {
+            "url": url,
+            "domain": domain,
+            "title": None,  # No title extracted
+            "content": None,  # No content extracted
+            "extracted_at": time.time(),
+            "access_restricted": True,
+        }
+
     def _extract_title(self, soup: BeautifulSoup) -> str:
         """Extract the title from the page."""
         if soup.title:
@@ -131,26 +327,7 @@ class ContentExtractor:
             element.decompose()
 
         # Try to find main content container
-        main_content = None
-
-        # Look for common content containers by ID
-        for id_value in ["content", "main", "article", "post", "entry"]:
-            element = soup.find(id=re.compile(f"^{id_value}$|^main-{id_value}$", re.I))
-            if element:
-                main_content = element
-                break
-
-        # Look for common content containers by class
-        if not main_content:
-            for class_value in ["content", "article", "post", "entry", "story"]:
-                element = soup.find(class_=re.compile(f"^{class_value}$|^main-{class_value}$", re.I))
-                if element:
-                    main_content = element
-                    break
-
-        # Look for article tag
-        if not main_content:
-            main_content = soup.find("article")
+        main_content = self._find_content_container(soup)
 
         # Fall back to body if no specific container is found
         if not main_content:
@@ -161,9 +338,39 @@ class ContentExtractor:
             main_content = soup
 
         # Get text and clean it up
-        text = main_content.get_text(separator=" ", strip=True)
-
-        # Remove excessive whitespace
-        text = re.sub(r"\s+", " ", text).strip()
+        # Get text in a single pass, splitting each string on whitespace so runs of
+        # whitespace inside a string collapse to a single space as well
+        text = " ".join(word for string in main_content.stripped_strings for word in string.split())
 
         return text
+
+    def _find_content_container(self, soup: BeautifulSoup) -> Optional[Tag]:
+        """
+        Find the most likely main content container in a single pass over the tree.
+
+        Elements are ranked by their ID, then their classes, then whether they are an
+        <article> tag, and the first element in document order with the best rank wins.
+        """
+        best_element = None
+        best_rank = _ARTICLE_RANK + 1
+
+        for element in soup.descendants:
+            if not isinstance(element, Tag):
+                continue
+
+            rank = _ARTICLE_RANK if element.name == "article" else best_rank
+
+            element_id = element.get("id")
+            if element_id:
+                rank = min(rank, _ID_RANKS.get(element_id.lower(), rank))
+
+            for class_name in element.get("class", ()):
+                rank = min(rank, _CLASS_RANKS.get(class_name.lower(), rank))
+
+            if rank < best_rank:
+                best_element, best_rank = element, rank
+                # Nothing can beat the most preferred ID
+                if rank == 0:
+                    break
+
+        return best_element
@@ -2,25 +2,196 @@
 Service for delivering summaries to various platforms.
 """
 
+import atexit
+import functools
+import html
 import logging
+import queue
+import threading
 import time
 import smtplib
 import json
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from typing import Dict, Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from email import policy
+from email.message import EmailMessage
+from dataclasses import dataclass
+from typing import Dict, Any, Iterator, List, Optional, Sequence, Tuple, Union
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from abc import ABC, abstractmethod
 
+from utils.rate_limiter import RateLimiter
+
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+except ImportError:
+
+    def _dumps(obj):
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
 logger = logging.getLogger(__name__)
 
+# Static parts of the HTML email. The CSS is kept out of format templates because of its braces.
+_EMAIL_CSS_STYLE = """
+            <style>
+                body { font-family: Arial, sans-serif; line-height: 1.6; color: #333; }
+                h1 { color: #2c3e50; }
+                h2 { color: #3498db; margin-top: 20px; }
+                .story { margin-bottom: 30px; border-bottom: 1px solid #eee; padding-bottom: 20px; }
+                .meta { color: #7f8c8d; font-size: 0.9em; margin-bottom: 10px; }
+                .summary { line-height: 1.8; }
+                a { color: #3498db; text-decoration: none; }
+                a:hover { text-decoration: underline; }
+                .restricted { color: #95a5a6; font-style: italic; }
+            </style>
+        """
+_EMAIL_HTML_HEAD = (
+    """
+        <html>
+        <head>
+            """
+    + _EMAIL_CSS_STYLE
+    + """
+        </head>
+        <body>
+            """
+)
+_EMAIL_HTML_TITLE_TEMPLATE = """<h1>Hacker News Top Stories - {date}</h1>
+        """
+_EMAIL_HTML_FOOT = """
+        </body>
+        </html>
+        """
+
+# Templates for a single story in emails. Values substituted into the HTML templates must be escaped.
+_TEXT_STORY_TEMPLATE = (
+    "{index}. {title}\nURL: {url}\nPoints: {score} | Comments: {comments}\n\n{summary}\n\n" + "-" * 80 + "\n\n"
+)
+_EMAIL_RESTRICTED_TEMPLATE = """
+            <div class="story">
+                <h2>{index_prefix}{link}</h2>
+                <p class="restricted"><em>このコンテンツはアクセス制限があるため要約できませんでした。</em></p>
+            </div>
+            """
+_EMAIL_STORY_TEMPLATE = """
+            <div class="story">
+                <h2>{index_prefix}{link}</h2>
+                <div class="meta">
+                    {by} | 
+                    <a href="https://news.ycombinator.com/item?id={id}">Discuss on HN</a>
+                </div>
+                <div class="summary">
+                    {summary}
+                </div>
+            </div>
+            """
+# Bound format methods of the per-story templates, so the lookup isn't repeated for every story
+_format_text_story = _TEXT_STORY_TEMPLATE.format
+_format_email_restricted = _EMAIL_RESTRICTED_TEMPLATE.format
+_format_email_story = _EMAIL_STORY_TEMPLATE.format
+
+# Maximum number of recipients per SMTP transaction
+_SMTP_RECIPIENTS_PER_MESSAGE = 50
+
+# Maximum number of blocks Slack accepts in a single message
+_MAX_BLOCKS_PER_MESSAGE = 50
+# Maximum number of characters Slack accepts in a section block's text
+_MAX_SECTION_TEXT_LENGTH = 3000
+
+# Shared stand-in for a missing story, so lookups don't allocate a new dict per summary
+_EMPTY: Dict[str, Any] = {}
+
+
+@dataclass(slots=True, frozen=True)
+class RenderedSummary:
+    """Flat view of a summary dictionary with the fields every delivery method renders."""
+
+    title: str
+    url: Optional[str]
+    by: str
+    item_id: str
+    score: int
+    comments: int
+    summary_text: str
+    is_restricted: bool
+
+    @classmethod
+    def from_summary(cls, summary: Union[Dict[str, Any], "RenderedSummary"]) -> "RenderedSummary":
+        """Build a rendered summary from a summary dictionary, passing rendered summaries through."""
+        if isinstance(summary, cls):
+            return summary
+
+        story = summary.get("story") or _EMPTY
+        get = story.get
+        return cls(
+            title=get("title", "Unknown Title"),
+            url=get("url"),
+            by=get("by", ""),
+            item_id=str(get("id", "")),
+            score=get("score", 0),
+            comments=get("descendants", 0),
+            summary_text=summary.get("summary", "No summary available"),
+            is_restricted=summary.get("access_restricted", False),
+        )
+
+
+# Summaries can be passed to delivery methods either as dictionaries or pre-rendered
+SummaryLike = Union[Dict[str, Any], RenderedSummary]
+
+
+def _chunk_text(text: str, size: int) -> Iterator[str]:
+    """
+    Yield consecutive pieces of text of at most size characters.
+
+    Text that already fits is yielded as is, without copying. Slicing by character
+    rather than by encoded byte keeps multi-byte characters, such as Japanese, intact.
+    """
+    if len(text) <= size:
+        yield text
+        return
+    for start in range(0, len(text), size):
+        yield text[start : start + size]
+
+
+@functools.lru_cache(maxsize=4)
+def _slack_header_blocks(date_str: str) -> Tuple[Dict[str, Any], ...]:
+    """Build the Slack header blocks for a date once; the blocks are shared and must not be modified."""
+    return (
+        {
+            "type": "header",
+            "text": {"type": "plain_text", "text": f"Hacker News Top Stories - {date_str}", "emoji": True},
+        },
+        {"type": "divider"},
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _render_slack_link(url: str, title: str) -> str:
+    """Render a story title as a bold Slack mrkdwn link."""
+    return f"*<{url}|{title}>*"
+
+
+@functools.lru_cache(maxsize=256)
+def _render_html_link(url: str, title: str) -> str:
+    """Render a story title as an escaped HTML link."""
+    return f'<a href="{html.escape(str(url))}">{html.escape(str(title))}</a>'
+
+
+def _today() -> str:
+    """Return today's date as shown in deliveries."""
+    return time.strftime("%Y-%m-%d")
+
 
 class DeliveryMethod(ABC):
     """Abstract base class for delivery methods."""
 
     @abstractmethod
-    def send(self, summaries: List[Dict[str, Any]]) -> bool:
-        """Send summaries using the delivery method."""
+    def send(self, summaries: Sequence[SummaryLike], date_str: Optional[str] = None) -> bool:
+        """Send summaries using the delivery method, dated date_str (default: today)."""
         pass
 
 
@@ -41,6 +212,10 @@ class EmailDelivery(DeliveryMethod):
         self.sender = config.get("sender", self.username)
         self.recipients = config.get("recipients", [])
         self.subject_template = config.get("subject_template", "Hacker News Top Stories - {date}")
+        # Body variants to include: "plain", "html", or both
+        content_types = config.get("content_types", ("plain", "html"))
+        # A single variant may be given as a plain string, e.g. "content_types: html"
+        self.content_types = (content_types,) if isinstance(content_types, str) else tuple(content_types)
 
         if not self.username or not self.password:
             raise ValueError("Email username and password are required")
@@ -48,36 +223,60 @@ class EmailDelivery(DeliveryMethod):
         if not self.recipients:
             raise ValueError("At least one recipient email is required")
 
-    def send(self, summaries: List[Dict[str, Any]]) -> bool:
+        if not self.content_types or not set(self.content_types) <= {"plain", "html"}:
+            raise ValueError("Email content_types must be 'plain', 'html', or both")
+
+        # Authenticated SMTP connection, opened on first send and reused until shutdown
+        self._smtp: Optional[smtplib.SMTP] = None
+        atexit.register(self._close)
+
+        # Story formatters indexed by whether the story's content is access restricted
+        self._formatters = (self._format_story_for_email, self._format_restricted_for_email)
+
+    def send(self, summaries: Sequence[SummaryLike], date_str: Optional[str] = None) -> bool:
         """
         Send summaries via email.
 
         Args:
-            summaries: List of summary dictionaries
+            summaries: List of summary dictionaries or rendered summaries
+            date_str: Date shown in the email, formatted as YYYY-MM-DD (default: today)
 
         Returns:
             True if successful, False otherwise
         """
         try:
-            # Create message
-            msg = MIMEMultipart("alternative")
-            msg["Subject"] = self.subject_template.format(date=time.strftime("%Y-%m-%d"))
+            date_str = date_str or _today()
+
+            # Create message, using the SMTP policy's CRLF line endings so it is generated once for sending
+            msg = EmailMessage(policy=policy.SMTP)
+            msg["Subject"] = self.subject_template.format(date=date_str)
             msg["From"] = self.sender
             msg["To"] = ", ".join(self.recipients)
 
-            # Create plain text and HTML content
-            text_content = self._create_text_content(summaries)
-            html_content = self._create_html_content(summaries)
-
-            # Attach parts
-            msg.attach(MIMEText(text_content, "plain"))
-            msg.attach(MIMEText(html_content, "html"))
+            # Create only the plain text and HTML content that was asked for
+            if "plain" in self.content_types:
+                msg.set_content(self._create_text_content(summaries, date_str))
+            if "html" in self.content_types:
+                html_content = self._create_html_content(summaries, date_str)
+                if "plain" in self.content_types:
+                    msg.add_alternative(html_content, subtype="html")
+                else:
+                    msg.set_content(html_content, subtype="html")
 
             # Send email
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.username, self.password)
-                server.send_message(msg)
+            # Serialize the message once and reuse it for every group of recipients
+            body = msg.as_bytes()
+            server = self._get_server()
+            try:
+                for start in range(0, len(self.recipients), _SMTP_RECIPIENTS_PER_MESSAGE):
+                    recipients = self.recipients[start : start + _SMTP_RECIPIENTS_PER_MESSAGE]
+                    refused = server.sendmail(self.sender, recipients, body)
+                    if refused:
+                        logger.warning(f"Email was refused for {len(refused)} recipients: {', '.join(refused)}")
+            except Exception:
+                # Don't reuse a connection in an unknown state
+                self._close()
+                raise
 
             logger.info(f"Successfully sent email to {len(self.recipients)} recipients")
             return True
@@ -86,89 +285,94 @@ class EmailDelivery(DeliveryMethod):
             logger.error(f"Error sending email: {str(e)}")
             return False
 
-    def _create_text_content(self, summaries: List[Dict[str, Any]]) -> str:
-        """Create plain text content for email."""
-        content = f"Hacker News Top Stories - {time.strftime('%Y-%m-%d')}\n\n"
+    def _get_server(self) -> smtplib.SMTP:
+        """Return the cached SMTP connection if it is still alive, otherwise connect and log in."""
+        if self._smtp is not None:
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._close()
+
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+        try:
+            server.starttls()
+            server.login(self.username, self.password)
+        except Exception:
+            server.close()
+            raise
+
+        self._smtp = server
+        return server
+
+    def _close(self) -> None:
+        """Close the cached SMTP connection, if any."""
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            self._smtp.close()
+        self._smtp = None
 
-        for i, summary in enumerate(summaries, 1):
-            story = summary.get("story", {})
-            content += f"{i}. {story.get('title', 'Unknown Title')}\n"
-            content += f"URL: {story.get('url', 'No URL')}\n"
-            content += f"Points: {story.get('score', 0)} | "
-            content += f"Comments: {story.get('descendants', 0)}\n\n"
-            content += f"{summary.get('summary', 'No summary available')}\n\n"
-            content += "-" * 80 + "\n\n"
+    def _create_text_content(self, summaries: Sequence[SummaryLike], date_str: Optional[str] = None) -> str:
+        """Create plain text content for email."""
+        parts = [f"Hacker News Top Stories - {date_str or _today()}\n\n"]
+        append = parts.append
+
+        for i, summary in enumerate(map(RenderedSummary.from_summary, summaries), 1):
+            append(
+                _format_text_story(
+                    index=i,
+                    title=summary.title,
+                    url=summary.url or "No URL",
+                    score=summary.score,
+                    comments=summary.comments,
+                    summary=summary.summary_text,
+                )
+            )
 
-        return content
+        return "".join(parts)
 
-    def _create_html_content(self, summaries: List[Dict[str, Any]]) -> str:
+    def _create_html_content(self, summaries: Sequence[SummaryLike], date_str: Optional[str] = None) -> str:
         """Create HTML content for email."""
-        # Create CSS style as a separate string to avoid f-string issues with backslashes
-        css_style = """
-            <style>
-                body { font-family: Arial, sans-serif; line-height: 1.6; color: #333; }
-                h1 { color: #2c3e50; }
-                h2 { color: #3498db; margin-top: 20px; }
-                .story { margin-bottom: 30px; border-bottom: 1px solid #eee; padding-bottom: 20px; }
-                .meta { color: #7f8c8d; font-size: 0.9em; margin-bottom: 10px; }
-                .summary { line-height: 1.8; }
-                a { color: #3498db; text-decoration: none; }
-                a:hover { text-decoration: underline; }
-                .restricted { color: #95a5a6; font-style: italic; }
-            </style>
-        """
-
         # Create HTML content with the date
-        content = f"""
-        <html>
-        <head>
-            {css_style}
-        </head>
-        <body>
-            <h1>Hacker News Top Stories - {time.strftime('%Y-%m-%d')}</h1>
-        """
+        parts = [_EMAIL_HTML_HEAD, _EMAIL_HTML_TITLE_TEMPLATE.format(date=date_str or _today())]
 
-        for i, summary in enumerate(summaries, 1):
-            # Format each summary using the existing method
-            content += self._format_summary_for_email(summary, index=i)
+        # Format each summary using the existing method
+        parts.extend(self._format_summary_for_email(summary, index=i) for i, summary in enumerate(summaries, 1))
 
-        content += """
-        </body>
-        </html>
-        """
+        parts.append(_EMAIL_HTML_FOOT)
 
-        return content
+        return "".join(parts)
 
     # メールテンプレート内の処理例を修正
     def _format_summary_for_email(self, summary, index=None):
-        index_prefix = f"{index}. " if index is not None else ""
-        story = summary.get("story", {})
-
-        if summary.get("access_restricted", False):
-            # アクセス制限のある記事は要約なしでタイトルとURLだけ表示
-            return f"""
-            <div class="story">
-                <h2>{index_prefix}<a href="{story.get('url', '#')}">{story.get('title', 'Unknown Title')}</a></h2>
-                <p class="restricted"><em>このコンテンツはアクセス制限があるため要約できませんでした。</em></p>
-            </div>
-            """
-        else:
-            # 通常の要約付き記事
-            # Replace newlines with <br> tags before adding to the HTML
-            summary_text = summary.get("summary", "No summary available").replace("\n", "<br>")
-
-            return f"""
-            <div class="story">
-                <h2>{index_prefix}<a href="{story.get('url', '#')}">{story.get('title', 'Unknown Title')}</a></h2>
-                <div class="meta">
-                    {story.get('by', '')} | 
-                    <a href="https://news.ycombinator.com/item?id={story.get('id', '')}">Discuss on HN</a>
-                </div>
-                <div class="summary">
-                    {summary_text}
-                </div>
-            </div>
-            """
+        summary = RenderedSummary.from_summary(summary)
+        return self._formatters[bool(summary.is_restricted)](summary, index)
+
+    def _format_restricted_for_email(self, summary: RenderedSummary, index: Optional[int] = None) -> str:
+        """Format an access restricted story for email."""
+        # アクセス制限のある記事は要約なしでタイトルとURLだけ表示
+        return _format_email_restricted(
+            index_prefix=f"{index}. " if index is not None else "",
+            link=_render_html_link(summary.url or "#", summary.title),
+        )
+
+    def _format_story_for_email(self, summary: RenderedSummary, index: Optional[int] = None) -> str:
+        """Format a summarized story for email."""
+        # 通常の要約付き記事
+        # Escape the summary, then replace newlines with <br> tags before adding to the HTML
+        summary_text = html.escape(summary.summary_text).replace("\n", "<br>")
+
+        return _format_email_story(
+            index_prefix=f"{index}. " if index is not None else "",
+            link=_render_html_link(summary.url or "#", summary.title),
+            by=html.escape(str(summary.by)),
+            id=html.escape(summary.item_id),
+            summary=summary_text,
+        )
 
 
 class SlackDelivery(DeliveryMethod):
@@ -186,52 +390,62 @@ class SlackDelivery(DeliveryMethod):
         self.username = config.get("username", "HN Summarizer Bot")
         self.icon_emoji = config.get("icon_emoji", ":newspaper:")
         self.max_summaries_per_message = config.get("max_summaries_per_message", 10)
+        # Slack allows about one message per second per webhook
+        self._limiter = RateLimiter(config.get("rps", 1))
 
         if not self.webhook_url:
             raise ValueError("Slack webhook URL is required")
 
-    def send(self, summaries: List[Dict[str, Any]]) -> bool:
+        # Keep the connection to the webhook alive across batches. Webhook posts aren't idempotent, so
+        # only retry when the message can't have been posted: connection failures and rate limits.
+        # Server errors and read timeouts fail the batch instead of risking a duplicate message.
+        self._session = requests.Session()
+        self._session.headers.update({"Content-Type": "application/json"})
+        self._session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=1,
+                # Up to five attempts in total, backing off exponentially or as long as Retry-After asks
+                max_retries=Retry(
+                    total=4,
+                    read=0,
+                    other=0,
+                    backoff_factor=0.5,
+                    status_forcelist=(429,),
+                    allowed_methods=frozenset(["POST"]),
+                    respect_retry_after_header=True,
+                ),
+            ),
+        )
+
+    def send(self, summaries: Sequence[SummaryLike], date_str: Optional[str] = None) -> bool:
         """
         Send summaries to Slack.
 
         Args:
-            summaries: List of summary dictionaries
+            summaries: List of summary dictionaries or rendered summaries
+            date_str: Date shown in the message header, formatted as YYYY-MM-DD (default: today)
 
         Returns:
             True if successful, False otherwise
         """
         try:
-            # Split summaries into batches to avoid message size limits
-            batches = [
-                summaries[i : i + self.max_summaries_per_message]
-                for i in range(0, len(summaries), self.max_summaries_per_message)
-            ]
-
             success = True
-            for batch in batches:
-                # Create message blocks
-                blocks = self._create_message_blocks(batch)
-
-                # Prepare payload
-                payload = {
+            # Split summaries into batches to avoid message size limits
+            payloads = [
+                {
                     "channel": self.channel,
                     "username": self.username,
                     "icon_emoji": self.icon_emoji,
                     "blocks": blocks,
                 }
+                for blocks in self._create_message_batches(summaries, date_str)
+            ]
 
-                # Send to Slack
-                response = requests.post(
-                    self.webhook_url,
-                    json=payload,
-                    headers={"Content-Type": "application/json"},
-                    timeout=10,
-                )
-                response.raise_for_status()
-
-                # Add delay between batches
-                if len(batches) > 1:
-                    time.sleep(1)
+            # Send batches one at a time so the stories appear in ranking order, spaced out by the rate limiter
+            for payload in payloads:
+                self._post_payload(payload)
 
             logger.info(f"Successfully sent {len(summaries)} summaries to Slack")
             return success
@@ -243,74 +457,79 @@ class SlackDelivery(DeliveryMethod):
             logger.error(f"Error in Slack delivery: {str(e)}")
             return False
 
-    def _create_message_blocks(self, summaries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _post_payload(self, payload: Dict[str, Any]) -> None:
+        """Post a single message payload to the webhook, waiting for the rate limiter first."""
+        self._limiter.acquire()
+        response = self._session.post(self.webhook_url, data=_dumps(payload), timeout=10)
+        response.raise_for_status()
+
+    def _create_message_batches(
+        self, summaries: Sequence[SummaryLike], date_str: Optional[str] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Group summaries into the message blocks of one or more Slack messages.
+
+        Each message holds at most max_summaries_per_message summaries and never more
+        than Slack's block limit. A summary's blocks are never split across messages.
+        """
+        header_blocks = self._create_header_blocks(date_str)
+        batches = []
+        blocks = None
+        count = 0
+
+        for summary in summaries:
+            summary_blocks = self._create_summary_blocks(summary)
+            if (
+                blocks is None
+                or count >= self.max_summaries_per_message
+                or len(blocks) + len(summary_blocks) > _MAX_BLOCKS_PER_MESSAGE
+            ):
+                if blocks is not None:
+                    batches.append(blocks)
+                blocks = list(header_blocks)
+                count = 0
+
+            blocks.extend(summary_blocks)
+            count += 1
+
+        if blocks is not None:
+            batches.append(blocks)
+
+        return batches
+
+    def _create_message_blocks(
+        self, summaries: Sequence[SummaryLike], date_str: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
         """Create Slack message blocks for summaries."""
-        blocks = [
-            {
-                "type": "header",
-                "text": {
-                    "type": "plain_text",
-                    "text": f"Hacker News Top Stories - {time.strftime('%Y-%m-%d')}",
-                    "emoji": True,
-                },
-            },
-            {"type": "divider"},
+        return self._create_header_blocks(date_str) + [
+            block for summary in summaries for block in self._create_summary_blocks(summary)
         ]
 
-        for summary in summaries:
-            # Add story header with title and URL
-            story = summary.get("story", {})
-            blocks.append(
-                {
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": f"*<{story.get('url', '#')}|{story.get('title', 'Unknown Title')}>*",
-                    },
-                }
-            )
+    def _create_header_blocks(self, date_str: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Create the header blocks that start every Slack message."""
+        return list(_slack_header_blocks(date_str or _today()))
 
-            # Check if content is access restricted
-            if summary.get("access_restricted", False):
-                # Add a note about restricted access
-                blocks.append(
-                    {
-                        "type": "section",
-                        "text": {
-                            "type": "mrkdwn",
-                            "text": "_このコンテンツはアクセス制限があるため要約できませんでした。_",
-                        },
-                    }
-                )
-            else:
-                # Add summary for accessible content
-                summary_text = summary.get("summary", "No summary available")
-                # Split long summaries into multiple blocks if needed
-                if len(summary_text) > 3000:
-                    max_length = 3000
-                    parts = []
-                    for i in range(0, len(summary_text), max_length):
-                        parts.append(summary_text[i : i + max_length])
-
-                    for part in parts:
-                        blocks.append(
-                            {
-                                "type": "section",
-                                "text": {"type": "mrkdwn", "text": part},
-                            }
-                        )
-                else:
-                    blocks.append(
-                        {
-                            "type": "section",
-                            "text": {"type": "mrkdwn", "text": summary_text},
-                        }
-                    )
+    def _create_summary_blocks(self, summary: SummaryLike) -> List[Dict[str, Any]]:
+        """Create the Slack message blocks for a single summary: title, summary text, and a divider."""
+        summary = RenderedSummary.from_summary(summary)
 
-            # Add divider between stories
-            blocks.append({"type": "divider"})
+        if summary.is_restricted:
+            # Add a note about restricted access
+            texts = ["_このコンテンツはアクセス制限があるため要約できませんでした。_"]
+        else:
+            # Split long summaries into multiple blocks if needed
+            texts = _chunk_text(summary.summary_text, _MAX_SECTION_TEXT_LENGTH)
 
-        return blocks
+        return [
+            # Story header with title and URL
+            {
+                "type": "section",
+                "text": {"type": "mrkdwn", "text": _render_slack_link(summary.url or "#", summary.title)},
+            },
+            *({"type": "section", "text": {"type": "mrkdwn", "text": text}} for text in texts),
+            # Divider between stories
+            {"type": "divider"},
+        ]
 
 
 class DeliveryService:
@@ -329,6 +548,13 @@ class DeliveryService:
         self.methods = []
         self._initialize_delivery_methods()
 
+        # Deliveries queued for the background worker, which is started on first use
+        self._queue: "queue.Queue[Tuple[List[Dict[str, Any]], str]]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._condition = threading.Condition()
+        self._pending = 0
+        self._all_success = True
+
     def _initialize_delivery_methods(self) -> None:
         """Initialize delivery methods based on configuration."""
         method_name = self.config.get("method", "email").lower()
@@ -349,35 +575,80 @@ class DeliveryService:
 
     def deliver(self, summaries: List[Dict[str, Any]]) -> bool:
         """
-        Deliver summaries using all configured methods.
+        Queue summaries for delivery using all configured methods.
+
+        Deliveries run on a background worker thread, so this returns as soon as the
+        summaries are queued. Call flush() to wait for them and get their outcome.
 
         Args:
             summaries: List of summary dictionaries
 
         Returns:
-            True if all deliveries were successful, False otherwise
+            True if the summaries were queued, False if no delivery methods are configured
         """
         if not self.methods:
             logger.error("No delivery methods configured")
             return False
 
+        # Date every delivery the same, even if the methods run across midnight
+        date_str = _today()
+
+        with self._condition:
+            self._pending += 1
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="delivery-worker", daemon=True)
+                self._worker.start()
+
+        self._queue.put((summaries, date_str))
+        logger.info(f"Queued {len(summaries)} summaries for delivery")
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for all queued deliveries to finish.
+
+        Args:
+            timeout: Maximum number of seconds to wait, or None to wait indefinitely
+
+        Returns:
+            True if every delivery queued since the last flush finished and succeeded,
+            False if any failed or the timeout expired
+        """
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._pending == 0, timeout):
+                logger.warning("Timed out waiting for deliveries to finish")
+                return False
+
+            all_success = self._all_success
+            self._all_success = True
+            return all_success
+
+    def _run(self) -> None:
+        """Deliver queued summaries until the process exits."""
+        while True:
+            summaries, date_str = self._queue.get()
+            success = self._deliver_now(summaries, date_str)
+            with self._condition:
+                self._pending -= 1
+                self._all_success = self._all_success and success
+                self._condition.notify_all()
+
+    def _deliver_now(self, summaries: List[Dict[str, Any]], date_str: str) -> bool:
+        """Deliver summaries using all configured methods and return whether all succeeded."""
         try:
             logger.info(f"Delivering {len(summaries)} summaries via {len(self.methods)} method(s)")
 
-            # Track success of all delivery methods
-            all_success = True
+            # Flatten the summaries once instead of in every delivery method
+            rendered = [RenderedSummary.from_summary(summary) for summary in summaries]
 
-            # Deliver using each initialized method
-            for method in self.methods:
-                method_name = method.__class__.__name__
-                logger.info(f"Delivering via {method_name}")
+            # Deliver using each initialized method concurrently, as each one waits on its own network calls
+            with ThreadPoolExecutor(max_workers=len(self.methods)) as executor:
+                results = list(
+                    executor.map(lambda method: self._deliver_with(method, rendered, date_str), self.methods)
+                )
 
-                success = method.send(summaries)
-                if success:
-                    logger.info(f"Delivery via {method_name} completed successfully")
-                else:
-                    logger.warning(f"Delivery via {method_name} failed")
-                    all_success = False
+            # Track success of all delivery methods
+            all_success = all(results)
 
             if all_success:
                 logger.info("All deliveries completed successfully")
@@ -389,3 +660,15 @@ class DeliveryService:
         except Exception as e:
             logger.error(f"Error in delivery service: {str(e)}")
             return False
+
+    def _deliver_with(self, method: DeliveryMethod, summaries: Sequence[SummaryLike], date_str: str) -> bool:
+        """Deliver summaries using a single method and log the outcome."""
+        method_name = method.__class__.__name__
+        logger.info(f"Delivering via {method_name}")
+
+        success = method.send(summaries, date_str=date_str)
+        if success:
+            logger.info(f"Delivery via {method_name} completed successfully")
+        else:
+            logger.warning(f"Delivery via {method_name} failed")
+        return success
@@ -2,14 +2,61 @@
 Service for fetching stories from Hacker News API.
 """
 
+import atexit
+import functools
+import json
 import logging
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any
 import time
 
+from utils.cache import DiskCache
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
+def _shared_session(pool_maxsize: int) -> requests.Session:
+    """
+    Get the HTTP session shared by every fetcher with the given pool size.
+
+    Args:
+        pool_maxsize: Number of connections to the API host kept alive
+
+    Returns:
+        Session whose connections are reused across HNFetcher instances
+    """
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=pool_maxsize,
+            # Back off exponentially, waiting as long as Retry-After asks when throttled
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=(429, 500, 502, 503, 504),
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            ),
+        ),
+    )
+    atexit.register(session.close)
+    return session
+
+
 class HNFetcher:
     """
     Service for fetching stories from the Hacker News API.
@@ -22,14 +69,22 @@ class HNFetcher:
 
     BASE_URL = "https://hacker-news.firebaseio.com/v0"
 
-    def __init__(self, request_delay: float = 0.5):
+    def __init__(self, max_workers: int = 8, cache_ttl: float = 300):
         """
         Initialize the HN Fetcher.
 
         Args:
-            request_delay: Delay between API requests in seconds to avoid rate limiting
+            max_workers: Maximum number of story requests in flight at once
+            cache_ttl: Number of seconds fetched stories are reused for, or 0 to disable the cache
         """
-        self.request_delay = request_delay
+        self.max_workers = max_workers
+        # Scores and comment counts keep changing, so stories are only cached briefly
+        self.cache_ttl = cache_ttl
+        self.cache = DiskCache() if cache_ttl else None
+
+        # Every request goes to the same API host, so keep one connection per worker alive,
+        # shared with other fetchers so repeated runs in one process skip the TLS handshake
+        self.session = _shared_session(max_workers)
 
     def fetch_top_stories(self, limit: int = 10) -> List[Dict[str, Any]]:
         """
@@ -44,25 +99,24 @@ class HNFetcher:
         try:
             # Get IDs of top stories
             top_stories_url = f"{self.BASE_URL}/topstories.json"
-            response = requests.get(top_stories_url, timeout=10)
+            response = self.session.get(top_stories_url, timeout=10)
             response.raise_for_status()
 
-            story_ids = response.json()[:limit]
-            logger.debug(f"Fetched {len(story_ids)} top story IDs")
+            story_ids = _loads(response.content)[:limit]
+            logger.debug("Fetched %d top story IDs", len(story_ids))
 
-            # Fetch details for each story
-            stories = []
-            for story_id in story_ids:
-                story = self._fetch_story(story_id)
-                if story and "url" in story:  # Only include stories with URLs
-                    stories.append(story)
-                time.sleep(self.request_delay)  # Avoid rate limiting
+            # Fetch details for each story concurrently; the pool size bounds the load on the API
+            with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(story_ids)))) as executor:
+                fetched = list(executor.map(self._fetch_story, story_ids))
 
-            logger.info(f"Successfully fetched {len(stories)} stories with URLs")
+            # Only include stories with URLs, keeping the top stories order
+            stories = [story for story in fetched if story and "url" in story]
+
+            logger.info("Successfully fetched %d stories with URLs", len(stories))
             return stories
 
-        except requests.RequestException as e:
-            logger.error(f"Error fetching top stories: {str(e)}")
+        except (requests.RequestException, ValueError) as e:
+            logger.error("Error fetching top stories: %s", e)
             raise
 
     def _fetch_story(self, story_id: int) -> Dict[str, Any]:
@@ -75,19 +129,29 @@ class HNFetcher:
         Returns:
             Story details as a dictionary
         """
+        cache_key = f"hn:item:{story_id}"
+        if self.cache is not None:
+            story = self.cache.get(cache_key, self.cache_ttl)
+            if story is not None:
+                logger.debug("Using cached story: %s", story.get("title", "Unknown"))
+                return story
+
         try:
             story_url = f"{self.BASE_URL}/item/{story_id}.json"
-            response = requests.get(story_url, timeout=10)
+            response = self.session.get(story_url, timeout=10)
             response.raise_for_status()
 
-            story = response.json()
-            logger.debug(f"Fetched story: {story.get('title', 'Unknown')}")
+            story = _loads(response.content)
+            logger.debug("Fetched story: %s", story.get("title", "Unknown"))
 
             # Add a timestamp for when we fetched this story
             story["fetched_at"] = time.time()
 
+            if self.cache is not None:
+                self.cache.set(cache_key, story)
+
             return story
 
-        except requests.RequestException as e:
-            logger.error(f"Error fetching story {story_id}: {str(e)}")
+        except (requests.RequestException, ValueError) as e:
+            logger.error("Error fetching story %s: %s", story_id, e)
             return None
@@ -2,26 +2,184 @@
 Service for summarizing content using various LLM providers.
 """
 
+import atexit
+import hashlib
 import logging
 import json
 import time
-from typing import Dict, Any, Optional, List
-import requests
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterator, Optional, List, Tuple
 from abc import ABC, abstractmethod
-import os
-from google.cloud import secretmanager
+
+from utils.cache import DiskCache
+from utils.semantic_cache import SemanticCache
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# Imported once per process; only required when Gemini is the configured provider
+try:
+    import google.generativeai as genai
+    from google.api_core import exceptions as google_exceptions, retry as google_retry
+except ImportError:
+    genai = None
+
 
 logger = logging.getLogger(__name__)
 
+# Providers already initialized in this process, keyed by their settings and a hash of the API key
+_PROVIDER_CACHE: Dict[Tuple[Any, ...], "LLMProvider"] = {}
+
+# Prompt templates, filled in with str.format
+_ARTICLE_TEMPLATE = """Title: {title}
+URL: {url}
+Points: {score}
+Comments: {descendants}
+
+Content:
+{body}
+"""
+_PROMPT_TEMPLATE = """
+Please summarize the following article from Hacker News in Japanese:
+
+{article}
+記事の主要なポイント、重要な洞察、重要な詳細を捉えた簡潔な要約（3〜5段落）を日本語で提供してください。
+要約は元の記事を読んでいない人にとって有益で分かりやすいものにしてください。
+前置きは含めず、直接要約の内容から始めてください。
+箇条書きではなく、流れのある文章形式で提供してください。
+"""
+_BATCH_PROMPT_TEMPLATE = """
+Please summarize each of the following {count} articles from Hacker News in Japanese:
+
+{articles}
+各記事について、記事の主要なポイント、重要な洞察、重要な詳細を捉えた簡潔な要約（3〜5段落）を日本語で提供してください。
+要約は元の記事を読んでいない人にとって有益で分かりやすいものにしてください。
+前置きは含めず、直接要約の内容から始めてください。
+箇条書きではなく、流れのある文章形式で提供してください。
+記事と同じ順序で{count}個の要約を含むJSON配列（文字列の配列）のみを返してください。
+"""
+
+# Rough number of ASCII characters per token, used to estimate prompt length locally
+_CHARS_PER_TOKEN = 4
+
+# Gemini finish reasons of completions whose text can be used as a summary
+_COMPLETE_FINISH_REASONS = ("STOP", "MAX_TOKENS")
+
+
+def _truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    Truncate text to roughly max_tokens tokens.
+
+    The Gemini tokenizer is only available through an API call, so the length is
+    estimated: about four ASCII characters per token and a token for every other
+    character, which is close for Japanese and other CJK text.
+
+    Args:
+        text: Text to truncate
+        max_tokens: Maximum estimated number of tokens to keep
+
+    Returns:
+        The longest prefix of text within the estimate
+    """
+    # No character counts as more than one token, so short text always fits
+    if len(text) <= max_tokens:
+        return text
+
+    budget = max_tokens * _CHARS_PER_TOKEN
+    if text.isascii():
+        return text[:budget]
+
+    # Count in quarter tokens: one per ASCII character and four per other character
+    remaining = budget
+    for index, char in enumerate(text[:budget]):
+        remaining -= 1 if char < "\x80" else _CHARS_PER_TOKEN
+        if remaining < 0:
+            return text[:index]
+    return text[:budget]
+
 
 class LLMProvider(ABC):
     """Abstract base class for LLM providers."""
 
+    # Maximum estimated tokens of article content included in a prompt
+    max_input_tokens: int = 4000
+    # Optional llmlingua PromptCompressor applied to article content, set by Summarizer
+    compressor: Any = None
+
     @abstractmethod
     def generate_summary(self, story: Dict[str, Any], content: Dict[str, Any]) -> str:
         """Generate a summary using the LLM provider."""
         pass
 
+    def generate_summaries(self, items: List[Tuple[Dict[str, Any], Dict[str, Any]]]) -> List[str]:
+        """
+        Generate summaries for several stories.
+
+        Providers that can summarize several articles in one request override this;
+        by default each story is summarized separately.
+
+        Args:
+            items: (story, content) pairs to summarize
+
+        Returns:
+            Generated summaries, in the same order as items
+        """
+        return [self.generate_summary(story, content) for story, content in items]
+
+    def generate_summary_iter(self, story: Dict[str, Any], content: Dict[str, Any]) -> Iterator[str]:
+        """
+        Generate a summary, yielding it in pieces as they arrive.
+
+        Providers that can stream completions override this; by default the whole
+        summary is yielded at once.
+
+        Args:
+            story: Story metadata from Hacker News
+            content: Content extracted from the URL
+
+        Yields:
+            Consecutive pieces of the generated summary
+        """
+        yield self.generate_summary(story, content)
+
+    def _compress(self, text: str) -> str:
+        """Compress article content with the prompt compressor, if one is configured."""
+        if self.compressor is None or not text:
+            return text
+
+        try:
+            return self.compressor.compress_prompt(text, rate=0.5, force_tokens=["\n", "?"])["compressed_prompt"]
+        except Exception as e:
+            logger.warning("Prompt compression failed, sending the content uncompressed: %s", e)
+            return text
+
+    def _format_article(self, story: Dict[str, Any], content: Dict[str, Any]) -> str:
+        """Format a story and its content for inclusion in a prompt."""
+        body = content.get("content") or "No content available"
+        return _ARTICLE_TEMPLATE.format(
+            title=story.get("title", "Unknown Title"),
+            url=story.get("url", "No URL"),
+            score=story.get("score", 0),
+            descendants=story.get("descendants", 0),
+            body=self._compress(_truncate_to_tokens(body, self.max_input_tokens)),
+        )
+
+    def _create_prompt(self, story: Dict[str, Any], content: Dict[str, Any]) -> str:
+        """Create a prompt asking the LLM to summarize an article."""
+        return _PROMPT_TEMPLATE.format(article=self._format_article(story, content))
+
+    def _create_batch_prompt(self, items: List[Tuple[Dict[str, Any], Dict[str, Any]]]) -> str:
+        """Create a prompt asking the LLM to summarize several articles at once."""
+        articles = "\n".join(
+            f"--- Article {index} ---\n{self._format_article(story, content)}"
+            for index, (story, content) in enumerate(items, start=1)
+        )
+        return _BATCH_PROMPT_TEMPLATE.format(count=len(items), articles=articles)
+
 
 class GeminiProvider(LLMProvider):
     """Google Gemini API provider for summarization."""
@@ -31,6 +189,7 @@ class GeminiProvider(LLMProvider):
         api_key: str,
         model: str = "gemini-2.0-flash",
         max_tokens: int = 500,
+        max_input_tokens: int = 4000,
     ):
         """
         Initialize the Gemini provider.
@@ -39,23 +198,45 @@ class GeminiProvider(LLMProvider):
             api_key: Google API key
             model: Model to use (default: gemini-1.5-flash-latest)
             max_tokens: Maximum tokens for the summary
+            max_input_tokens: Maximum estimated tokens of article content included in a prompt
         """
         self.api_key = api_key
         self.model = model
         self.max_tokens = max_tokens
+        self.max_input_tokens = max_input_tokens
 
         # Log the model being used
-        logger.info(f"Initializing Gemini provider with model: {model}")
-
-        # Import here to avoid requiring the package if not using Gemini
-        try:
-            import google.generativeai as genai
+        logger.info("Initializing Gemini provider with model: %s", model)
 
-            self.genai = genai
-            self.genai.configure(api_key=self.api_key)
-        except ImportError:
+        if genai is None:
             logger.error("google-generativeai package not installed. Install with: pip install google-generativeai")
-            raise
+            raise ImportError("google-generativeai package not installed")
+
+        self.genai = genai
+        self.genai.configure(api_key=self.api_key)
+
+        # The model doesn't depend on the prompt, so build it once and reuse it for every story
+        self._generation_config = {
+            "max_output_tokens": self.max_tokens,
+            "temperature": 0.4,
+            "top_p": 0.95,
+        }
+        self._model = self.genai.GenerativeModel(model_name=self.model, generation_config=self._generation_config)
+
+        # Back off exponentially when rate limited (429) or the service is briefly unavailable
+        self._request_options = {
+            "retry": google_retry.Retry(
+                predicate=google_retry.if_exception_type(
+                    google_exceptions.ResourceExhausted,
+                    google_exceptions.ServiceUnavailable,
+                    google_exceptions.InternalServerError,
+                ),
+                initial=1.0,
+                multiplier=2.0,
+                maximum=30.0,
+                timeout=120.0,
+            )
+        }
 
     def generate_summary(self, story: Dict[str, Any], content: Dict[str, Any]) -> str:
         """
@@ -72,57 +253,107 @@ class GeminiProvider(LLMProvider):
             # Create prompt
             prompt = self._create_prompt(story, content)
 
-            # Configure model
-            generation_config = {
-                "max_output_tokens": self.max_tokens,
-                "temperature": 0.4,
-                "top_p": 0.95,
-            }
-
-            logger.info(f"Using Gemini model: {self.model}")
+            logger.info("Using Gemini model: %s", self.model)
 
-            # Generate response
+            # Generate response, streaming it so the connection isn't idle until the whole summary is ready
             try:
-                model = self.genai.GenerativeModel(model_name=self.model, generation_config=generation_config)
-
-                response = model.generate_content(prompt)
-
-                # Extract summary from response
-                summary = response.text.strip()
+                summary = "".join(self._stream(prompt)).strip()
 
                 return summary
             except ImportError as e:
-                logger.error(f"ImportError with google.generativeai: {str(e)}")
+                logger.error("ImportError with google.generativeai: %s", e)
                 raise
             except AttributeError as e:
-                logger.error(f"AttributeError with Gemini API: {str(e)}")
+                logger.error("AttributeError with Gemini API: %s", e)
                 raise
             except ValueError as e:
-                logger.error(f"ValueError with Gemini API (possibly invalid model name '{self.model}'): {str(e)}")
+                logger.error("ValueError with Gemini API (possibly invalid model name '%s'): %s", self.model, e)
                 raise
 
         except Exception as e:
-            logger.error(f"Gemini API request failed: {str(e)}")
+            logger.error("Gemini API request failed: %s", e)
             raise
 
-    def _create_prompt(self, story: Dict[str, Any], content: Dict[str, Any]) -> str:
-        """Create a prompt for the Gemini API."""
-        return f"""
-Please summarize the following article from Hacker News in Japanese:
+    def generate_summary_iter(self, story: Dict[str, Any], content: Dict[str, Any]) -> Iterator[str]:
+        """
+        Generate a summary using Google Gemini, yielding it in pieces as they arrive.
 
-Title: {story.get('title', 'Unknown Title')}
-URL: {story.get('url', 'No URL')}
-Points: {story.get('score', 0)}
-Comments: {story.get('descendants', 0)}
+        Args:
+            story: Story metadata from Hacker News
+            content: Content extracted from the URL
 
-Content:
-{content.get('content', 'No content available')[:4000]}
+        Yields:
+            Consecutive pieces of the generated summary
+        """
+        yield from self._stream(self._create_prompt(story, content))
 
-記事の主要なポイント、重要な洞察、重要な詳細を捉えた簡潔な要約（3〜5段落）を日本語で提供してください。
-要約は元の記事を読んでいない人にとって有益で分かりやすいものにしてください。
-前置きは含めず、直接要約の内容から始めてください。
-箇条書きではなく、流れのある文章形式で提供してください。
-"""
+    def _stream(self, prompt: str) -> Iterator[str]:
+        """
+        Stream the text of a Gemini completion for the prompt.
+
+        Raises:
+            ValueError: If the completion is empty or was cut short, e.g. by the safety filters
+        """
+        chunk = None
+        has_text = False
+        for chunk in self._model.generate_content(prompt, stream=True, request_options=self._request_options):
+            # Chunks without parts (e.g. the final one carrying only the finish reason) have no text
+            if chunk.parts:
+                text = chunk.text
+                has_text = has_text or bool(text.strip())
+                yield text
+
+        # The finish reason arrives with the last chunk; hitting the token limit still leaves a usable summary
+        candidates = chunk.candidates if chunk is not None else None
+        finish_reason = getattr(candidates[0].finish_reason, "name", None) if candidates else None
+        if finish_reason not in _COMPLETE_FINISH_REASONS:
+            raise ValueError(f"Gemini completion did not finish (finish reason: {finish_reason})")
+        if not has_text:
+            raise ValueError("Gemini returned an empty completion")
+
+    def generate_summaries(self, items: List[Tuple[Dict[str, Any], Dict[str, Any]]]) -> List[str]:
+        """
+        Generate summaries for several stories with a single Gemini request.
+
+        Args:
+            items: (story, content) pairs to summarize
+
+        Returns:
+            Generated summaries, in the same order as items
+
+        Raises:
+            ValueError: If the response is not a JSON array with one summary per story
+        """
+        try:
+            prompt = self._create_batch_prompt(items)
+
+            # Ask for JSON so the summaries can be split reliably
+            generation_config = {
+                **self._generation_config,
+                "max_output_tokens": self.max_tokens * len(items),
+                "response_mime_type": "application/json",
+            }
+
+            logger.info("Using Gemini model: %s for %d stories", self.model, len(items))
+
+            # Reuse the model, overriding its generation config for this request only
+            response = self._model.generate_content(
+                prompt, generation_config=generation_config, request_options=self._request_options
+            )
+
+            summaries = _loads(response.text)
+            if (
+                not isinstance(summaries, list)
+                or len(summaries) != len(items)
+                or not all(isinstance(summary, str) for summary in summaries)
+            ):
+                raise ValueError(f"Expected a JSON array of {len(items)} summaries from Gemini")
+
+            return [summary.strip() for summary in summaries]
+
+        except Exception as e:
+            logger.error("Gemini batch request failed: %s", e)
+            raise
 
 
 class Summarizer:
@@ -139,6 +370,22 @@ class Summarizer:
         """
         self.config = config
         self.provider = self._initialize_provider()
+        if self.provider.compressor is None:
+            self.provider.compressor = self._initialize_compressor()
+
+        # Settings that change the generated summary, read once for every cache key
+        self._cache_key_settings = (
+            self.config.get("provider", "openai"),
+            self.config.get("gemini_model", "gemini-1.5-flash-latest"),
+            self.config.get("max_tokens", 500),
+            self.config.get("max_input_tokens", 4000),
+            self.config.get("compress_prompt", False),
+        )
+        self.cache = self._initialize_cache()
+
+        # Identical inputs produce equivalent summaries, so exact matches are reused for days
+        self.summary_cache_ttl = self.config.get("summary_cache_ttl", 3 * 24 * 3600)
+        self.summary_cache = DiskCache() if self.summary_cache_ttl else None
 
     def _initialize_provider(self) -> LLMProvider:
         """Initialize the LLM provider based on configuration."""
@@ -146,20 +393,114 @@ class Summarizer:
 
         if provider_name == "gemini":
             api_key = self.config.get("gemini_api_key")
-            logger.info(f"Gemini API key present: {bool(api_key)}")
-            logger.info(f"Gemini config: {self.config}")
+            logger.info("Gemini API key present: %s", bool(api_key))
+            if logger.isEnabledFor(logging.DEBUG):
+                # Never write API keys to the logs
+                redacted = {key: "***" if "api_key" in key else value for key, value in self.config.items()}
+                logger.debug("Gemini config: %s", redacted)
 
             if not api_key:
                 raise ValueError("Google API key is required for Gemini")
 
             model = self.config.get("gemini_model", "gemini-1.5-flash-latest")
             max_tokens = self.config.get("max_tokens", 500)
-
-            return GeminiProvider(api_key, model, max_tokens)
+            max_input_tokens = self.config.get("max_input_tokens", 4000)
+
+            # Reuse the provider of an earlier Summarizer with the same settings
+            key = (
+                provider_name,
+                model,
+                max_tokens,
+                max_input_tokens,
+                self.config.get("compress_prompt", False),
+                hashlib.sha256(api_key.encode()).hexdigest(),
+            )
+            provider = _PROVIDER_CACHE.get(key)
+            if provider is None:
+                provider = _PROVIDER_CACHE[key] = GeminiProvider(api_key, model, max_tokens, max_input_tokens)
+            return provider
 
         else:
             raise ValueError(f"Unsupported LLM provider: {provider_name}")
 
+    def _initialize_compressor(self) -> Any:
+        """Initialize the llmlingua prompt compressor if it is enabled in the configuration."""
+        if not self.config.get("compress_prompt", False):
+            return None
+
+        # Import here to avoid requiring the package, and loading its model, if compression is disabled
+        try:
+            from llmlingua import PromptCompressor
+        except ImportError:
+            logger.warning(
+                "llmlingua package not installed, prompt compression disabled. Install with: pip install llmlingua"
+            )
+            return None
+
+        return PromptCompressor()
+
+    def _initialize_cache(self) -> Optional[SemanticCache]:
+        """Initialize the semantic summary cache if it is enabled in the configuration."""
+        if not self.config.get("cache_enabled", False):
+            return None
+
+        try:
+            cache = SemanticCache(
+                model_name=self.config.get("cache_model", "sentence-transformers/all-MiniLM-L6-v2"),
+                threshold=self.config.get("cache_threshold", 0.92),
+                ttl=self.config.get("cache_ttl", 7 * 24 * 3600),
+                settings=self._cache_key_settings,
+            )
+        except ImportError:
+            logger.warning(
+                "sentence-transformers or faiss-cpu package not installed, semantic cache disabled. "
+                "Install with: pip install sentence-transformers faiss-cpu"
+            )
+            return None
+
+        atexit.register(cache.save)
+        return cache
+
+    def _cache_key(self, story: Dict[str, Any], content: Dict[str, Any]) -> Optional[str]:
+        """
+        Get the exact-match cache key for summarizing a story with the configured provider.
+
+        Returns None for stories without content, which are never cached: their summaries
+        depend on the story metadata alone, and many such stories would share a key.
+        """
+        text = content.get("content")
+        if not text:
+            return None
+
+        key_parts = [*self._cache_key_settings, story.get("id"), story.get("url"), story.get("title"), text]
+        digest = hashlib.sha256(json.dumps(key_parts, ensure_ascii=False).encode()).hexdigest()
+        return f"summary:{digest}"
+
+    def _lookup(self, story: Dict[str, Any], content: Dict[str, Any]) -> Tuple[Optional[str], Any]:
+        """Look up a cached summary for the story, returning it with the content's embedding."""
+        if self.summary_cache is not None:
+            key = self._cache_key(story, content)
+            summary_text = self.summary_cache.get(key, self.summary_cache_ttl) if key else None
+            if summary_text is not None:
+                return summary_text, None
+
+        # Stories without content would all get the same embedding, so they skip the semantic cache too
+        text = content.get("content")
+        if self.cache is None or not text:
+            return None, None
+
+        embedding = self.cache.encode(text)
+        return self.cache.get(embedding), embedding
+
+    def _remember(self, embedding: Any, story: Dict[str, Any], content: Dict[str, Any], summary_text: str) -> None:
+        """Add a generated summary to the enabled caches."""
+        if self.summary_cache is not None:
+            key = self._cache_key(story, content)
+            if key:
+                self.summary_cache.set(key, summary_text)
+        if embedding is not None:
+            self.cache.add(embedding, summary_text, story.get("url"))
+
     def summarize(self, story: Dict[str, Any], content: Dict[str, Any]) -> Dict[str, Any]:
         """
         Summarize the content of a story.
@@ -171,28 +512,132 @@ class Summarizer:
         Returns:
             Dictionary containing the story, content, and summary
         """
+        title = story.get("title", "Unknown")
         try:
-            logger.info(f"Summarizing story: {story.get('title', 'Unknown')}")
+            logger.info("Summarizing story: %s", title)
+
+            # Reuse the summary of the same or a similar article if one is cached
+            summary_text, embedding = self._lookup(story, content)
+            if summary_text is not None:
+                logger.info("Using cached summary for story: %s", title)
+                return self._create_result(story, content, summary_text)
 
             # Generate summary using the provider
             summary_text = self.provider.generate_summary(story, content)
+            self._remember(embedding, story, content, summary_text)
 
-            # Create result dictionary
-            result = {
-                "story": story,
-                "content": {
-                    "title": content.get("title"),
-                    "url": content.get("url"),
-                    "domain": content.get("domain"),
-                    "content_length": len(content.get("content", "")),
-                },
-                "summary": summary_text,
-                "summarized_at": time.time(),
-            }
-
-            logger.info(f"Successfully summarized story: {story.get('title', 'Unknown')}")
-            return result
+            logger.info("Successfully summarized story: %s", title)
+            return self._create_result(story, content, summary_text)
 
         except Exception as e:
-            logger.error(f"Error summarizing story: {str(e)}")
+            logger.error("Error summarizing story: %s", e)
             raise
+
+    def summarize_batch(
+        self,
+        items: List[Tuple[Dict[str, Any], Dict[str, Any]]],
+        max_workers: int = 8,
+        batch_size: Optional[int] = None,
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Summarize several stories, packing up to batch_size of them into each provider request.
+
+        Stories with a cached summary of the same or a similar article are not sent to the provider.
+        Batch requests run concurrently. If a batch request fails or returns a malformed
+        response, the stories in it are summarized separately instead, with up to
+        max_workers requests in flight.
+
+        Args:
+            items: (story, content) pairs to summarize
+            max_workers: Maximum number of concurrent provider requests
+            batch_size: Maximum number of stories per request (default: the batch_size setting, or 5)
+
+        Returns:
+            Dictionaries containing the story, content, and summary, in the same order as
+            items, with None for stories that could not be summarized
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+
+        # Reuse cached summaries of the same or similar articles and only send the rest to the provider.
+        # A story whose lookup fails is left as None rather than failing the whole batch.
+        embeddings: List[Any] = [None] * len(items)
+        pending = []
+        cached = 0
+        for index, (story, content) in enumerate(items):
+            try:
+                summary_text, embeddings[index] = self._lookup(story, content)
+                if summary_text is None:
+                    pending.append(index)
+                else:
+                    results[index] = self._create_result(story, content, summary_text)
+                    cached += 1
+            except Exception as e:
+                logger.error("Error summarizing story %s: %s", story.get("title", "Unknown"), e)
+
+        if cached:
+            logger.info("Using %d cached summaries", cached)
+        if not pending:
+            return results
+
+        batch_size = max(1, batch_size or self.config.get("batch_size", 5))
+        batches = [pending[start : start + batch_size] for start in range(0, len(pending), batch_size)]
+        logger.info("Summarizing %d stories in %d batch(es)", len(pending), len(batches))
+
+        # Each request is a separate network round trip, so overlap them in threads
+        failed = []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as executor:
+            batch_texts = executor.map(lambda batch: self._try_generate_summaries([items[i] for i in batch]), batches)
+            for batch, summary_texts in zip(batches, batch_texts):
+                if summary_texts is None:
+                    failed.extend(batch)
+                    continue
+                for index, summary_text in zip(batch, summary_texts):
+                    results[index] = self._try_create_result(*items[index], embeddings[index], summary_text)
+
+        if failed:
+            logger.warning("Summarizing %d stories from failed batches one by one", len(failed))
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(failed))) as executor:
+                fallback_results = executor.map(lambda index: self._try_summarize(*items[index]), failed)
+                for index, result in zip(failed, fallback_results):
+                    results[index] = result
+        return results
+
+    def _try_generate_summaries(self, items: List[Tuple[Dict[str, Any], Dict[str, Any]]]) -> Optional[List[str]]:
+        """Generate summaries for a batch of stories, returning None if the batch request failed."""
+        try:
+            return self.provider.generate_summaries(items)
+        except Exception as e:
+            logger.warning("Batch summarization failed: %s", e)
+            return None
+
+    def _try_create_result(
+        self, story: Dict[str, Any], content: Dict[str, Any], embedding: Any, summary_text: str
+    ) -> Optional[Dict[str, Any]]:
+        """Cache a generated summary and create its result, returning None if either step failed."""
+        try:
+            self._remember(embedding, story, content, summary_text)
+            return self._create_result(story, content, summary_text)
+        except Exception as e:
+            logger.error("Error summarizing story %s: %s", story.get("title", "Unknown"), e)
+            return None
+
+    def _try_summarize(self, story: Dict[str, Any], content: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Summarize a story, returning None if it could not be summarized."""
+        try:
+            return self.summarize(story, content)
+        except Exception:
+            return None
+
+    def _create_result(self, story: Dict[str, Any], content: Dict[str, Any], summary_text: str) -> Dict[str, Any]:
+        """Create the result dictionary for a summarized story."""
+        return {
+            "story": story,
+            "content": {
+                "title": content.get("title"),
+                "url": content.get("url"),
+                "domain": content.get("domain"),
+                "content_length": len(content.get("content", "")),
+            },
+            "summary": summary_text,
+            "summarized_at": time.time(),
+        }
@@ -0,0 +1,103 @@
+"""
+Cache locations and on-disk caches for the HN Summarizer.
+"""
+
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def get_cache_dir(*parts: str) -> str:
+    """
+    Get the directory used for on-disk caches.
+
+    Honors XDG_CACHE_HOME and falls back to ~/.cache. The directory is not created.
+
+    Args:
+        parts: Optional path components to append below the cache directory
+
+    Returns:
+        Path to the cache directory
+    """
+    base_dir = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base_dir, "hn_summarizer", *parts)
+
+
+class DiskCache:
+    """
+    Exact-match key/value cache stored in a SQLite database.
+
+    Values are pickled and stored with the time they were written, so each lookup can
+    apply its own time-to-live. Safe to use from multiple threads. If the database
+    can't be opened or written, the cache logs a warning and behaves as if it were empty.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initialize the cache, creating the database if needed.
+
+        Args:
+            path: Path to the SQLite database (default: cache.sqlite in the cache directory)
+        """
+        self.path = path or os.path.join(get_cache_dir(), "cache.sqlite")
+        self._lock = threading.Lock()
+        self._conn = None
+
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value BLOB, ts REAL)")
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("Could not open cache database %s, caching disabled: %s", self.path, e)
+            self._conn = None
+
+    def get(self, key: str, ttl: float) -> Optional[Any]:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+            ttl: Maximum age in seconds of a value that is still returned
+
+        Returns:
+            Cached value, or None if it is missing or older than ttl
+        """
+        if self._conn is None:
+            return None
+
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT value FROM cache WHERE key = ? AND ts >= ?", (key, time.time() - ttl)
+                ).fetchone()
+            return pickle.loads(row[0]) if row else None
+        except Exception as e:
+            logger.warning("Error reading cache entry %s: %s", key, e)
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a value in the cache, replacing any previous value for the key.
+
+        Args:
+            key: Cache key
+            value: Picklable value to store
+        """
+        if self._conn is None:
+            return
+
+        try:
+            blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO cache (key, value, ts) VALUES (?, ?, ?)", (key, blob, time.time())
+                )
+        except Exception as e:
+            logger.warning("Error writing cache entry %s: %s", key, e)
@@ -2,10 +2,32 @@
 Logger configuration for the HN Summarizer.
 """
 
+import atexit
+import gzip
 import logging
-import sys
-from datetime import datetime
+import logging.handlers
 import os
+import queue
+import shutil
+import sys
+
+# Number of days of rotated, gzip-compressed logs to keep
+_LOG_BACKUP_DAYS = 14
+
+# Listener writing queued records to the real handlers, replaced on each setup_logger call
+_listener = None
+
+
+def _gzip_namer(name: str) -> str:
+    """Name rotated log files with a .gz suffix."""
+    return name + ".gz"
+
+
+def _gzip_rotator(source: str, dest: str) -> None:
+    """Compress a rotated log file into dest and remove the original."""
+    with open(source, "rb") as f_in, gzip.open(dest, "wb") as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    os.remove(source)
 
 
 def setup_logger(level=logging.INFO):
@@ -15,6 +37,8 @@ def setup_logger(level=logging.INFO):
     Args:
         level: The logging level (default: INFO)
     """
+    global _listener
+
     # Create logs directory if it doesn't exist
     os.makedirs("logs", exist_ok=True)
 
@@ -22,7 +46,10 @@ def setup_logger(level=logging.INFO):
     root_logger = logging.getLogger()
     root_logger.setLevel(level)
 
-    # Clear any existing handlers
+    # Clear any existing handlers, stopping the listener of a previous setup first
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
 
@@ -35,14 +62,27 @@ def setup_logger(level=logging.INFO):
     console_handler.setLevel(level)
     console_handler.setFormatter(console_formatter)
 
-    # Create file handler
-    log_filename = f"logs/hn_summarizer_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-    file_handler = logging.FileHandler(log_filename)
+    # Create file handler, appending to one file per day and compressing the previous days'
+    file_handler = logging.handlers.TimedRotatingFileHandler(
+        "logs/hn_summarizer.log", when="midnight", backupCount=_LOG_BACKUP_DAYS, encoding="utf-8"
+    )
+    file_handler.namer = _gzip_namer
+    file_handler.rotator = _gzip_rotator
     file_handler.setLevel(level)
     file_handler.setFormatter(file_formatter)
 
-    # Add handlers to root logger
-    root_logger.addHandler(console_handler)
-    root_logger.addHandler(file_handler)
+    # Log through a queue so callers never wait on console or disk I/O; a background
+    # listener thread passes the records on to the real handlers
+    log_queue = queue.Queue(-1)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _listener = logging.handlers.QueueListener(log_queue, console_handler, file_handler, respect_handler_level=True)
+    _listener.start()
 
     return root_logger
+
+
+@atexit.register
+def _stop_listener():
+    """Write out any queued records before the interpreter exits."""
+    if _listener is not None:
+        _listener.stop()
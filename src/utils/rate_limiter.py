@@ -0,0 +1,47 @@
+"""
+Rate limiting for calls to external services.
+"""
+
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Token-bucket rate limiter.
+
+    Tokens refill continuously at rate per second up to burst tokens. Each call to
+    acquire() takes one token, sleeping only when the bucket is empty. Safe to use
+    from multiple threads.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            rate: Number of calls allowed per second on average
+            burst: Maximum number of calls allowed back to back
+        """
+        if rate <= 0:
+            raise ValueError("Rate must be positive")
+
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take a token, waiting until one is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+
+            # Reserve the token now so concurrent callers queue up behind each other
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
@@ -0,0 +1,183 @@
+"""
+Semantic cache of generated summaries, keyed by article content embeddings.
+"""
+
+import logging
+import os
+import pickle
+import threading
+import time
+from typing import Any, List, Optional, Tuple
+
+from utils.cache import get_cache_dir
+
+logger = logging.getLogger(__name__)
+
+# Number of characters of article content that are embedded, matching what the prompt includes
+_EMBED_CHARS = 4000
+# Number of nearest neighbours checked per lookup, so expired entries don't hide fresh ones
+_SEARCH_K = 4
+
+
+class SemanticCache:
+    """
+    Cache of summaries for articles whose content is similar to one already summarized.
+
+    Article content is embedded with a sentence-transformers model and looked up in a
+    FAISS inner-product index over normalized vectors, i.e. by cosine similarity.
+    Requires the optional sentence-transformers and faiss-cpu packages.
+    """
+
+    def __init__(
+        self,
+        model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
+        threshold: float = 0.92,
+        ttl: float = 7 * 24 * 3600,
+        cache_dir: Optional[str] = None,
+        settings: Tuple[Any, ...] = (),
+    ):
+        """
+        Initialize the semantic cache, loading any entries saved by a previous run.
+
+        Args:
+            model_name: Name of the sentence-transformers model used for embeddings
+            threshold: Minimum cosine similarity for a cached summary to be reused
+            ttl: Number of seconds a cached summary stays valid
+            cache_dir: Directory to persist the cache in (default: the user cache directory)
+            settings: Summarizer settings that change the generated summary; summaries
+                generated with different settings are never reused
+
+        Raises:
+            ImportError: If sentence-transformers or faiss is not installed
+        """
+        # Import here to avoid requiring the packages if the cache is disabled
+        import faiss
+        from sentence_transformers import SentenceTransformer
+
+        self.faiss = faiss
+        self.model_name = model_name
+        self.model = SentenceTransformer(model_name)
+        self.threshold = threshold
+        self.ttl = ttl
+        self.settings = tuple(settings)
+        self.cache_dir = cache_dir or get_cache_dir("semantic_cache")
+        self._index_path = os.path.join(self.cache_dir, "index.faiss")
+        self._entries_path = os.path.join(self.cache_dir, "entries.pkl")
+        self._lock = threading.Lock()
+
+        # (summary, timestamp, url, settings) for each vector in the index, in insertion order
+        self._entries: List[Tuple[str, float, Optional[str], Tuple[Any, ...]]] = []
+        self._index = None
+        self._load()
+        if self._index is None:
+            self._index = self._new_index()
+
+    def encode(self, text: str) -> Any:
+        """
+        Embed article content for lookups.
+
+        Args:
+            text: Article content
+
+        Returns:
+            Normalized embedding as a 1 x dimension float32 array
+        """
+        return self.model.encode([text[:_EMBED_CHARS]], normalize_embeddings=True).astype("float32")
+
+    def get(self, embedding: Any) -> Optional[str]:
+        """
+        Look up the summary of the most similar unexpired article.
+
+        Args:
+            embedding: Embedding returned by encode()
+
+        Returns:
+            Cached summary, or None if no article is similar enough
+        """
+        with self._lock:
+            if not self._index.ntotal:
+                return None
+
+            scores, ids = self._index.search(embedding, min(_SEARCH_K, self._index.ntotal))
+            now = time.time()
+            for score, entry_id in zip(scores[0], ids[0]):
+                if score < self.threshold:
+                    break
+                summary, timestamp, _, settings = self._entries[entry_id]
+                if now - timestamp <= self.ttl and settings == self.settings:
+                    return summary
+
+        return None
+
+    def add(self, embedding: Any, summary: str, url: Optional[str] = None) -> None:
+        """
+        Add a summary to the cache.
+
+        Args:
+            embedding: Embedding returned by encode() for the summarized article
+            summary: Generated summary
+            url: URL of the summarized article
+        """
+        with self._lock:
+            self._index.add(embedding)
+            self._entries.append((summary, time.time(), url, self.settings))
+
+    def save(self) -> None:
+        """Persist the cache so later runs can reuse it, dropping expired entries first."""
+        try:
+            with self._lock:
+                self._prune()
+                os.makedirs(self.cache_dir, exist_ok=True)
+                self.faiss.write_index(self._index, self._index_path)
+                with open(self._entries_path, "wb") as f:
+                    state = {"model_name": self.model_name, "settings": self.settings, "entries": self._entries}
+                    pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+            logger.debug("Saved %d semantic cache entries to %s", len(self._entries), self.cache_dir)
+        except Exception as e:
+            logger.warning("Error saving semantic cache: %s", e)
+
+    def _new_index(self) -> Any:
+        """Create an empty index for this model's embeddings."""
+        return self.faiss.IndexFlatIP(self.model.get_sentence_embedding_dimension())
+
+    def _prune(self) -> None:
+        """Rebuild the index without expired entries. Must be called with the lock held."""
+        now = time.time()
+        keep = [i for i, entry in enumerate(self._entries) if now - entry[1] <= self.ttl]
+        if len(keep) == len(self._entries):
+            return
+
+        index = self._new_index()
+        if keep:
+            vectors = self._index.reconstruct_n(0, self._index.ntotal)
+            index.add(vectors[keep])
+        logger.debug("Dropped %d expired semantic cache entries", len(self._entries) - len(keep))
+        self._index = index
+        self._entries = [self._entries[i] for i in keep]
+
+    def _load(self) -> None:
+        """Load the cache persisted by a previous run, if any."""
+        if not (os.path.exists(self._index_path) and os.path.exists(self._entries_path)):
+            return
+
+        try:
+            index = self.faiss.read_index(self._index_path)
+            with open(self._entries_path, "rb") as f:
+                state = pickle.load(f)
+            model_name, settings, entries = state["model_name"], state["settings"], state["entries"]
+        except Exception as e:
+            logger.warning("Error loading semantic cache, starting empty: %s", e)
+            return
+
+        # Embeddings from another model can't be compared with this one's, even at the same dimension,
+        # and summaries generated with other settings would not match what would be generated now
+        if model_name != self.model_name or settings != self.settings:
+            logger.info("Semantic cache in %s was built with other settings, starting empty", self.cache_dir)
+            return
+        if index.d != self.model.get_sentence_embedding_dimension() or index.ntotal != len(entries):
+            logger.warning("Semantic cache in %s does not match the embedding model, starting empty", self.cache_dir)
+            return
+
+        self._index = index
+        self._entries = entries
+        logger.debug("Loaded %d semantic cache entries from %s", len(entries), self.cache_dir)
@@ -3,24 +3,89 @@
 Utility script to switch between delivery methods in the config.yaml file.
 """
 
-import argparse
 import logging
 import os
+import stat
 import sys
+import tempfile
+import types
 import yaml
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
+# Use the libyaml C loader and dumper when PyYAML was built with them
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Delivery methods that can be switched to, mapped to the individual methods they enable
+_METHOD_TABLE = {
+    "email": ("email",),
+    "slack": ("slack",),
+    "email,slack": ("email", "slack"),
+    "slack,email": ("slack", "email"),
+}
+_USAGE = "usage: switch_delivery.py [-h] [--config CONFIG] {email,slack,email,slack,slack,email}"
+
+
+def parse_args(argv=None):
+    """
+    Parse command line arguments.
+
+    The usual method and --config arguments are parsed by hand, so that argparse is only
+    imported to print the full help for -h/--help.
+
+    Args:
+        argv: Arguments to parse (default: sys.argv[1:])
+
+    Returns:
+        Namespace with method and config attributes
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if "-h" in argv or "--help" in argv:
+        return _build_parser().parse_args(argv)
+
+    method = None
+    config = "config.yaml"
+    args = iter(argv)
+    for arg in args:
+        if arg == "--config":
+            config = next(args, None)
+            if config is None:
+                _usage_error("argument --config: expected one argument")
+        elif arg.startswith("--config="):
+            config = arg.split("=", 1)[1]
+        elif arg.startswith("-") or method is not None:
+            _usage_error(f"unrecognized arguments: {arg}")
+        else:
+            method = arg
+
+    if method is None:
+        _usage_error("the following arguments are required: method")
+    if method not in _METHOD_TABLE:
+        choices = ", ".join(f"'{choice}'" for choice in _METHOD_TABLE)
+        _usage_error(f"argument method: invalid choice: '{method}' (choose from {choices})")
+
+    return types.SimpleNamespace(method=method, config=config)
+
+
+def _usage_error(message):
+    """Print the usage and an error message, then exit like argparse does."""
+    print(_USAGE, file=sys.stderr)
+    print(f"{os.path.basename(sys.argv[0])}: error: {message}", file=sys.stderr)
+    sys.exit(2)
+
+
+def _build_parser():
+    """Build the argparse parser used to print the full help."""
+    import argparse
 
-def parse_args():
-    """Parse command line arguments."""
     parser = argparse.ArgumentParser(description="Switch delivery method in config.yaml")
     parser.add_argument(
         "method",
         type=str,
-        choices=["email", "slack", "email,slack", "slack,email"],
+        choices=_METHOD_TABLE,
         help="Delivery method to switch to (can be comma-separated for multiple methods)",
     )
     parser.add_argument(
@@ -29,7 +94,7 @@ def parse_args():
         default="config.yaml",
         help="Path to configuration file (default: config.yaml)",
     )
-    return parser.parse_args()
+    return parser
 
 
 def switch_delivery_method(config_path, method):
@@ -44,15 +109,18 @@ def switch_delivery_method(config_path, method):
         True if successful, False otherwise
     """
     try:
-        # Check if config file exists
-        if not os.path.exists(config_path):
-            logger.error(f"Configuration file {config_path} not found")
+        abs_path = os.path.abspath(config_path)
+        try:
+            # Read the config file; libyaml detects the encoding itself, so skip text-mode decoding.
+            # The raw bytes are kept to tell whether the rewritten file would differ at all.
+            with open(abs_path, "rb") as f:
+                st = os.fstat(f.fileno())
+                original = f.read()
+            config = yaml.load(original, Loader=_YAML_LOADER)
+        except FileNotFoundError:
+            logger.error("Configuration file %s not found", config_path)
             return False
 
-        # Read the config file
-        with open(config_path, "r") as f:
-            config = yaml.safe_load(f)
-
         # Check if the config has the expected structure
         if "delivery" not in config:
             logger.error("Invalid config file: 'delivery' section not found")
@@ -61,23 +129,52 @@ def switch_delivery_method(config_path, method):
         # Update the delivery method
         current_method = config["delivery"].get("method", "unknown")
         if current_method == method:
-            logger.info(f"Delivery method is already set to '{method}'")
+            logger.info("Delivery method is already set to '%s'", method)
             return True
 
         config["delivery"]["method"] = method
 
-        # Write the updated config back to the file
-        with open(config_path, "w") as f:
-            yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+        updated = yaml.dump(
+            config,
+            Dumper=_YAML_DUMPER,
+            default_flow_style=False,
+            sort_keys=False,
+            encoding="utf-8",
+            allow_unicode=True,
+        )
+
+        # Write the updated config back to the file, unless it is byte-for-byte the same
+        if updated != original:
+            _write_atomic(abs_path, updated, st.st_mode)
 
-        logger.info(f"Successfully switched delivery method from '{current_method}' to '{method}'")
+        logger.info("Successfully switched delivery method from '%s' to '%s'", current_method, method)
         return True
 
     except Exception as e:
-        logger.error(f"Error switching delivery method: {str(e)}")
+        logger.error("Error switching delivery method: %s", e)
         return False
 
 
+def _write_atomic(path, data, mode):
+    """
+    Replace a file's contents atomically, so a crash never leaves it half written.
+
+    Args:
+        path: Path of the file to replace
+        data: New contents
+        mode: Permission bits to give the new file
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".config-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.chmod(tmp_path, stat.S_IMODE(mode))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
 def main():
     """Main function."""
     args = parse_args()
@@ -89,10 +186,10 @@ def main():
         logger.error("Failed to switch delivery method")
         sys.exit(1)
 
-    logger.info(f"Delivery method switched to '{args.method}'")
+    logger.info("Delivery method switched to '%s'", args.method)
 
     # Provide next steps based on the selected method(s)
-    methods = args.method.split(",")
+    methods = _METHOD_TABLE[args.method]
 
     logger.info("Next steps:")
 
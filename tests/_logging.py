@@ -0,0 +1,21 @@
+"""
+Logging setup shared by the test scripts.
+"""
+
+import functools
+import logging
+
+from utils.logger import setup_logger
+
+
+@functools.lru_cache(maxsize=1)
+def ensure_test_logger():
+    """
+    Set up logging for the test scripts, only the first time it is called.
+
+    setup_logger already logs to stdout, so no extra console handler is added.
+
+    Returns:
+        The configured root logger
+    """
+    return setup_logger(logging.INFO)
@@ -0,0 +1,115 @@
+"""
+Shared fixtures for the test scripts.
+"""
+
+import copy
+import functools
+import time
+
+from services.delivery import EmailDelivery, SlackDelivery
+
+# Configurations the test scripts build their delivery objects from
+EMAIL_CONFIG = {
+    "username": "test@example.com",
+    "password": "password",
+    "recipients": ["recipient@example.com"],
+}
+SLACK_CONFIG = {"webhook_url": "https://hooks.slack.com/services/xxx/yyy/zzz"}
+
+# Summaries of an access-restricted and of a regular story, copied by make_restricted()/make_regular()
+_RESTRICTED_STORY = {
+    "story": {
+        "title": "Access Restricted Story",
+        "url": "https://example.com/restricted",
+        "score": 100,
+        "descendants": 50,
+        "by": "testuser",
+        "id": "12345",
+    },
+    "content": {
+        "url": "https://example.com/restricted",
+        "domain": "example.com",
+        "title": "Access Restricted Story",
+        "content_length": 0,
+    },
+    "summary": "このコンテンツはアクセス制限があるため要約できませんでした。",
+    "access_restricted": True,
+}
+_REGULAR_STORY = {
+    "story": {
+        "title": "Regular Story",
+        "url": "https://example.com/regular",
+        "score": 100,
+        "descendants": 50,
+        "by": "testuser",
+        "id": "67890",
+    },
+    "content": {
+        "url": "https://example.com/regular",
+        "domain": "example.com",
+        "title": "Regular Story",
+        "content_length": 1000,
+    },
+    "summary": "This is a regular story summary.",
+}
+
+
+def make_restricted():
+    """Get a copy of the access-restricted story summary, summarized now."""
+    return {**copy.deepcopy(_RESTRICTED_STORY), "summarized_at": time.time()}
+
+
+def make_regular():
+    """Get a copy of the regular story summary, summarized now."""
+    return {**copy.deepcopy(_REGULAR_STORY), "summarized_at": time.time()}
+
+
+def _config_key(config):
+    """Turn a configuration dictionary into a hashable, order-independent key."""
+    return tuple(sorted((key, tuple(value) if isinstance(value, list) else value) for key, value in config.items()))
+
+
+def _config_from_key(config_items):
+    """Rebuild the configuration dictionary from a key made by _config_key."""
+    return {key: list(value) if isinstance(value, tuple) else value for key, value in config_items}
+
+
+@functools.lru_cache(maxsize=8)
+def _make_email_delivery(config_items):
+    """Create the EmailDelivery shared by tests using the same configuration."""
+    return EmailDelivery(_config_from_key(config_items))
+
+
+@functools.lru_cache(maxsize=8)
+def _make_slack_delivery(config_items):
+    """Create the SlackDelivery shared by tests using the same configuration."""
+    return SlackDelivery(_config_from_key(config_items))
+
+
+def make_email_delivery(config=None):
+    """
+    Get an EmailDelivery for the configuration, shared by every test using the same one.
+
+    EmailDelivery only connects to the SMTP server when sending, so the shared instance
+    is cheap to create and safe to use for formatting tests.
+
+    Args:
+        config: Email configuration (default: EMAIL_CONFIG)
+
+    Returns:
+        EmailDelivery instance
+    """
+    return _make_email_delivery(_config_key(config or EMAIL_CONFIG))
+
+
+def make_slack_delivery(config=None):
+    """
+    Get a SlackDelivery for the configuration, shared by every test using the same one.
+
+    Args:
+        config: Slack configuration (default: SLACK_CONFIG)
+
+    Returns:
+        SlackDelivery instance
+    """
+    return _make_slack_delivery(_config_key(config or SLACK_CONFIG))
@@ -5,9 +5,11 @@ Very simple test script to verify the fix.
 
 import sys
 import os
+from pathlib import Path
 
-# Add src directory to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+# Add src directory to path when run directly; pytest uses the pythonpath setting in pyproject.toml
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
 
 from services.delivery import EmailDelivery
 
@@ -24,14 +26,12 @@ email_delivery = EmailDelivery(
 summary = {"summary": "This is a test summary."}
 
 # This would have caused a KeyError: 'url' before our fix
+result_file = Path("output", "test_result.txt")
+result_file.parent.mkdir(exist_ok=True)
 try:
     result = email_delivery._format_summary_for_email(summary, index=1)
-    with open(os.path.join("output", "test_result.txt"), "w") as f:
-        f.write("Test passed! No KeyError was raised.\n")
-        f.write(result)
+    result_file.write_text(f"Test passed! No KeyError was raised.\n{result}")
 except KeyError as e:
-    with open(os.path.join("output", "test_result.txt"), "w") as f:
-        f.write(f"Test failed! KeyError was raised: {e}\n")
+    result_file.write_text(f"Test failed! KeyError was raised: {e}\n")
 except Exception as e:
-    with open(os.path.join("output", "test_result.txt"), "w") as f:
-        f.write(f"Test failed! Exception was raised: {e}\n")
+    result_file.write_text(f"Test failed! Exception was raised: {e}\n")
@@ -5,9 +5,11 @@ Very simple test script to verify the fix for SlackDelivery.
 
 import sys
 import os
+from pathlib import Path
 
-# Add src directory to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+# Add src directory to path when run directly; pytest uses the pythonpath setting in pyproject.toml
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
 
 from services.delivery import SlackDelivery
 
@@ -18,14 +20,12 @@ slack_delivery = SlackDelivery({"webhook_url": "https://hooks.slack.com/services
 summary = {"summary": "This is a test summary."}
 
 # This would have caused a KeyError: 'url' before our fix
+result_file = Path("output", "test_result_slack.txt")
+result_file.parent.mkdir(exist_ok=True)
 try:
     blocks = slack_delivery._create_message_blocks([summary])
-    with open(os.path.join("output", "test_result_slack.txt"), "w") as f:
-        f.write("Test passed! No KeyError was raised.\n")
-        f.write(str(blocks))
+    result_file.write_text(f"Test passed! No KeyError was raised.\n{str(blocks)}")
 except KeyError as e:
-    with open(os.path.join("output", "test_result_slack.txt"), "w") as f:
-        f.write(f"Test failed! KeyError was raised: {e}\n")
+    result_file.write_text(f"Test failed! KeyError was raised: {e}\n")
 except Exception as e:
-    with open(os.path.join("output", "test_result_slack.txt"), "w") as f:
-        f.write(f"Test failed! Exception was raised: {e}\n")
+    result_file.write_text(f"Test failed! Exception was raised: {e}\n")
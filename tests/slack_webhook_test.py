@@ -9,13 +9,77 @@ import json
 import logging
 import os
 import sys
+import time
 import requests
-from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+except ImportError:
+
+    def _dumps(obj):
+        return json.dumps(obj).encode("utf-8")
+
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
+# Shared session so repeated posts reuse the connection, retrying rate limits and server errors
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=4,
+        max_retries=Retry(
+            total=5,
+            backoff_factor=0.2,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["POST"]),
+        ),
+    ),
+)
+
+# Test message payload, serialized once with a placeholder for the send time
+_TIMESTAMP_PLACEHOLDER = "__TIMESTAMP__"
+_PAYLOAD_TEMPLATE = _dumps(
+    {
+        "username": "HN Summarizer Bot",
+        "icon_emoji": ":newspaper:",
+        "blocks": [
+            {
+                "type": "header",
+                "text": {
+                    "type": "plain_text",
+                    "text": "HN Summarizer - Test Message",
+                    "emoji": True,
+                },
+            },
+            {"type": "divider"},
+            {
+                "type": "section",
+                "text": {
+                    "type": "mrkdwn",
+                    "text": "*This is a test message from HN Summarizer*\n\nIf you're seeing this, your Slack webhook integration is working correctly! 🎉",
+                },
+            },
+            {
+                "type": "context",
+                "elements": [
+                    {
+                        "type": "mrkdwn",
+                        "text": f"Sent at: {_TIMESTAMP_PLACEHOLDER}",
+                    }
+                ],
+            },
+        ],
+    }
+)
+
 
 def parse_args():
     """Parse command line arguments."""
@@ -45,66 +109,34 @@ def send_test_message(webhook_url, channel=None):
         True if successful, False otherwise
     """
     try:
-        # Create message blocks
-        blocks = [
-            {
-                "type": "header",
-                "text": {
-                    "type": "plain_text",
-                    "text": "HN Summarizer - Test Message",
-                    "emoji": True,
-                },
-            },
-            {"type": "divider"},
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": f"*This is a test message from HN Summarizer*\n\nIf you're seeing this, your Slack webhook integration is working correctly! 🎉",
-                },
-            },
-            {
-                "type": "context",
-                "elements": [
-                    {
-                        "type": "mrkdwn",
-                        "text": f"Sent at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-                    }
-                ],
-            },
-        ]
-
-        # Prepare payload
-        payload = {
-            "username": "HN Summarizer Bot",
-            "icon_emoji": ":newspaper:",
-            "blocks": blocks,
-        }
+        # Fill in the prebuilt payload
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S").encode("utf-8")
+        payload = _PAYLOAD_TEMPLATE.replace(_TIMESTAMP_PLACEHOLDER.encode("utf-8"), timestamp)
 
         # Add channel if provided
         if channel:
-            payload["channel"] = channel
+            payload = b'{"channel":' + _dumps(channel) + b"," + payload[1:]
 
         # Send to Slack
-        logger.info(f"Sending test message to Slack...")
-        response = requests.post(
+        logger.info("Sending test message to Slack...")
+        response = _SESSION.post(
             webhook_url,
-            json=payload,
+            data=payload,
             headers={"Content-Type": "application/json"},
             timeout=10,
         )
         response.raise_for_status()
 
-        logger.info(f"Test message sent successfully! Response: {response.status_code}")
+        logger.info("Test message sent successfully! Response: %d", response.status_code)
         return True
 
     except requests.RequestException as e:
-        logger.error(f"Error sending to Slack: {str(e)}")
+        logger.error("Error sending to Slack: %s", e)
         if hasattr(e, "response") and e.response:
-            logger.error(f"Response: {e.response.status_code} - {e.response.text}")
+            logger.error("Response: %d - %s", e.response.status_code, e.response.text)
         return False
     except Exception as e:
-        logger.error(f"Error in Slack delivery: {str(e)}")
+        logger.error("Error in Slack delivery: %s", e)
         return False
 
 
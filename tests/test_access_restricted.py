@@ -5,65 +5,22 @@ Test script to verify handling of access-restricted stories.
 
 import sys
 import os
-import time
 
-# Add src directory to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+# Add src directory to path when run directly; pytest uses the pythonpath setting in pyproject.toml
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
 
-from services.delivery import EmailDelivery
+from fixtures import make_email_delivery, make_regular, make_restricted
 
 
 def main():
     """Test handling of access-restricted stories."""
-    # Create a mock EmailDelivery instance
-    email_delivery = EmailDelivery(
-        {
-            "username": "test@example.com",
-            "password": "password",
-            "recipients": ["recipient@example.com"],
-        }
-    )
-
-    # Create a mock story with access restrictions
-    restricted_story = {
-        "story": {
-            "title": "Access Restricted Story",
-            "url": "https://example.com/restricted",
-            "score": 100,
-            "descendants": 50,
-            "by": "testuser",
-            "id": "12345",
-        },
-        "content": {
-            "url": "https://example.com/restricted",
-            "domain": "example.com",
-            "title": "Access Restricted Story",
-            "content_length": 0,
-        },
-        "summary": "このコンテンツはアクセス制限があるため要約できませんでした。",
-        "access_restricted": True,
-        "summarized_at": time.time(),
-    }
+    # Get the shared mock EmailDelivery instance
+    email_delivery = make_email_delivery()
 
-    # Create a mock regular story
-    regular_story = {
-        "story": {
-            "title": "Regular Story",
-            "url": "https://example.com/regular",
-            "score": 100,
-            "descendants": 50,
-            "by": "testuser",
-            "id": "67890",
-        },
-        "content": {
-            "url": "https://example.com/regular",
-            "domain": "example.com",
-            "title": "Regular Story",
-            "content_length": 1000,
-        },
-        "summary": "This is a regular story summary.",
-        "summarized_at": time.time(),
-    }
+    # Create mock story data
+    restricted_story = make_restricted()
+    regular_story = make_regular()
 
     # Test formatting both stories
     print("=== Access Restricted Story ===")
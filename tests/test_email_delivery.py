@@ -10,27 +10,21 @@ import os
 import time
 from datetime import datetime
 
-# Add src directory to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+# Add src directory to path when run directly; pytest uses the pythonpath setting in pyproject.toml
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
 
-from utils.logger import setup_logger
+from _logging import ensure_test_logger
 from services.delivery import EmailDelivery
 from config.settings import load_config
 
 
 def main():
     """Run a test of the email delivery."""
-    # Setup logging
-    setup_logger(logging.INFO)
+    # Setup logging, which also logs to the console
+    ensure_test_logger()
     logger = logging.getLogger(__name__)
 
-    # Also log to console
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(logging.INFO)
-    formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-    console_handler.setFormatter(formatter)
-    logging.getLogger().addHandler(console_handler)
-
     print("Starting email delivery test")
     logger.info("Starting email delivery test")
 
@@ -38,7 +32,7 @@ def main():
         # Load configuration
         config_path = "config.yaml"
         if not os.path.exists(config_path):
-            logger.warning(f"Configuration file {config_path} not found, using example config")
+            logger.warning("Configuration file %s not found, using example config", config_path)
             config_path = "config.yaml.example"
 
         config = load_config(config_path)
@@ -81,7 +75,7 @@ def main():
             logger.error("Email delivery test failed")
 
     except Exception as e:
-        logger.error(f"An error occurred during the test: {str(e)}")
+        logger.error("An error occurred during the test: %s", e)
         raise
 
 
@@ -6,22 +6,17 @@ Simple test script to verify the _format_summary_for_email method.
 import sys
 import os
 
-# Add src directory to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+# Add src directory to path when run directly; pytest uses the pythonpath setting in pyproject.toml
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
 
-from services.delivery import EmailDelivery
+from fixtures import make_email_delivery
 
 
 def main():
     """Test the _format_summary_for_email method."""
-    # Create a mock EmailDelivery instance
-    email_delivery = EmailDelivery(
-        {
-            "username": "test@example.com",
-            "password": "password",
-            "recipients": ["recipient@example.com"],
-        }
-    )
+    # Get the shared mock EmailDelivery instance
+    email_delivery = make_email_delivery()
 
     # Test case 1: Summary with story containing url and title
     summary1 = {
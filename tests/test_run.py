@@ -11,20 +11,18 @@ import os
 import json
 from datetime import datetime
 
-# Add src directory to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+# Add src directory to path when run directly; pytest uses the pythonpath setting in pyproject.toml
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
 
-from utils.logger import setup_logger
-from services.hn_fetcher import HNFetcher
-from services.content_extractor import ContentExtractor
-from services.summarizer import Summarizer
+from _logging import ensure_test_logger
 from config.settings import load_config
 
 
 def main():
     """Run a test of the HN Summarizer."""
     # Setup logging
-    setup_logger(logging.INFO)
+    ensure_test_logger()
     logger = logging.getLogger(__name__)
 
     logger.info("Starting HN Summarizer test run")
@@ -33,7 +31,7 @@ def main():
         # Load configuration
         config_path = "config.yaml"
         if not os.path.exists(config_path):
-            logger.warning(f"Configuration file {config_path} not found, using example config")
+            logger.warning("Configuration file %s not found, using example config", config_path)
             config_path = "config.yaml.example"
 
         config = load_config(config_path)
@@ -46,7 +44,10 @@ def main():
             logger.warning("OpenAI API key not found in config or environment variables")
             logger.info("This test will fetch content but won't be able to summarize without an API key")
 
-        # Initialize services
+        # Initialize services, importing them only once the configuration has loaded
+        from services.hn_fetcher import HNFetcher
+        from services.content_extractor import ContentExtractor
+
         hn_fetcher = HNFetcher()
         content_extractor = ContentExtractor()
 
@@ -59,19 +60,22 @@ def main():
             return
 
         story = top_stories[0]
-        logger.info(f"Fetched story: {story['title']}")
-        logger.info(f"URL: {story['url']}")
+        logger.info("Fetched story: %s", story["title"])
+        logger.info("URL: %s", story["url"])
 
         # Extract content
-        logger.info(f"Extracting content from: {story['url']}")
+        logger.info("Extracting content from: %s", story["url"])
         content = content_extractor.extract(story["url"])
 
-        logger.info(f"Successfully extracted {len(content['content'])} characters")
+        logger.info("Successfully extracted %d characters", len(content["content"]))
 
         # Try to summarize if API key is available
         try:
+            # The LLM SDKs are slow to import, so only pay for them when summarizing
+            from services.summarizer import Summarizer
+
             summarizer = Summarizer(config["summarizer"])
-            logger.info(f"Summarizing with {config['summarizer']['provider']}")
+            logger.info("Summarizing with %s", config["summarizer"]["provider"])
             summary = summarizer.summarize(story, content)
 
             # Print the summary
@@ -85,14 +89,14 @@ def main():
 
             logger.info("Summary generated successfully")
         except Exception as e:
-            logger.error(f"Error summarizing content: {str(e)}")
+            logger.error("Error summarizing content: %s", e)
             logger.info("Content extraction was successful, but summarization failed")
             logger.info("Check your API keys and configuration")
 
         logger.info("Test completed successfully")
 
     except Exception as e:
-        logger.error(f"An error occurred during the test: {str(e)}")
+        logger.error("An error occurred during the test: %s", e)
         raise
 
 
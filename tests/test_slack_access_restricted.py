@@ -5,71 +5,36 @@ Test script to verify handling of access-restricted stories in Slack delivery.
 
 import sys
 import os
-import time
 import json
 
-# Add src directory to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+# Add src directory to path when run directly; pytest uses the pythonpath setting in pyproject.toml
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
 
-from services.delivery import SlackDelivery
+from fixtures import make_slack_delivery, make_regular, make_restricted
 
 
 def main():
     """Test handling of access-restricted stories in Slack delivery."""
-    # Create a mock SlackDelivery instance
-    slack_delivery = SlackDelivery({"webhook_url": "https://hooks.slack.com/services/xxx/yyy/zzz"})
-
-    # Create a mock story with access restrictions
-    restricted_story = {
-        "story": {
-            "title": "Access Restricted Story",
-            "url": "https://example.com/restricted",
-            "score": 100,
-            "descendants": 50,
-            "by": "testuser",
-            "id": "12345",
-        },
-        "content": {
-            "url": "https://example.com/restricted",
-            "domain": "example.com",
-            "title": "Access Restricted Story",
-            "content_length": 0,
-        },
-        "summary": "このコンテンツはアクセス制限があるため要約できませんでした。",
-        "access_restricted": True,
-        "summarized_at": time.time(),
-    }
+    # Get the shared mock SlackDelivery instance
+    slack_delivery = make_slack_delivery()
 
-    # Create a mock regular story
-    regular_story = {
-        "story": {
-            "title": "Regular Story",
-            "url": "https://example.com/regular",
-            "score": 100,
-            "descendants": 50,
-            "by": "testuser",
-            "id": "67890",
-        },
-        "content": {
-            "url": "https://example.com/regular",
-            "domain": "example.com",
-            "title": "Regular Story",
-            "content_length": 1000,
-        },
-        "summary": "This is a regular story summary.",
-        "summarized_at": time.time(),
-    }
+    # Create mock story data
+    restricted_story = make_restricted()
+    regular_story = make_regular()
 
     # Test creating message blocks with both stories
     blocks = slack_delivery._create_message_blocks([restricted_story, regular_story])
 
-    # Print the blocks as JSON for inspection
-    print(json.dumps(blocks, indent=2))
+    # Serialize the blocks once and print them for inspection, keeping Japanese text readable
+    payload = json.dumps(blocks, indent=2, ensure_ascii=False)
+    print(payload)
 
-    # Write the blocks to a file for inspection
-    with open(os.path.join("output", "test_slack_blocks.json"), "w") as f:
-        json.dump(blocks, f, indent=2)
-    print("\nSlack blocks written to test_slack_blocks.json")
+    # Only write the blocks to a file when asked to, so CI runs skip the disk write
+    if os.environ.get("WRITE_ARTIFACTS"):
+        with open(os.path.join("output", "test_slack_blocks.json"), "w", encoding="utf-8") as f:
+            f.write(payload)
+        print("\nSlack blocks written to test_slack_blocks.json")
 
 
 if __name__ == "__main__":